@@ -1,16 +1,72 @@
 """Download ONNX model for embeddings."""
 
+import os
 import requests
 from pathlib import Path
 
 
+def optimize_model(model_path: Path, optimized_path: Path):
+    """Run ORT graph optimization once and save the result for reuse."""
+    import onnxruntime as ort
+
+    print(f"Optimizing model to {optimized_path}...")
+    sess_options = ort.SessionOptions()
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    sess_options.optimized_model_filepath = str(optimized_path)
+    ort.InferenceSession(
+        str(model_path), sess_options=sess_options, providers=["CPUExecutionProvider"]
+    )
+    print(f"✓ Optimized model saved to {optimized_path}")
+
+
+def quantize_model(model_path: Path, quantized_path: Path):
+    """Write an INT8 dynamically quantized copy of the raw model."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    print(f"Quantizing model to {quantized_path}...")
+    # Write to a temp file and rename, so a crash never leaves a truncated
+    # model behind that the app would later try to load
+    tmp_path = quantized_path.with_name(quantized_path.name + ".tmp")
+    try:
+        quantize_dynamic(
+            str(model_path),
+            str(tmp_path),
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=["MatMul", "Gemm"],
+        )
+        os.replace(tmp_path, quantized_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    print(f"✓ Quantized model saved to {quantized_path}")
+
+
+def convert_model_fp16(model_path: Path, fp16_path: Path):
+    """Write an FP16-weight copy of the raw model with FP32 inputs and outputs."""
+    import onnx
+    from onnxruntime.transformers.float16 import convert_float_to_float16
+
+    print(f"Converting model to FP16 at {fp16_path}...")
+    model = convert_float_to_float16(onnx.load(str(model_path)), keep_io_types=True)
+    onnx.save(model, str(fp16_path))
+    print(f"✓ FP16 model saved to {fp16_path}")
+
+
 def download_model():
-    """Download the all-MiniLM-L6-v2 ONNX model."""
+    """Download the all-MiniLM-L6-v2 ONNX model and build its optimized, INT8 and FP16 copies."""
     model_dir = Path("models/onnx")
     model_path = model_dir / "all-MiniLM-L6-v2.onnx"
+    optimized_path = model_dir / "all-MiniLM-L6-v2.opt.onnx"
+    quantized_path = model_dir / "all-MiniLM-L6-v2.int8.onnx"
+    fp16_path = model_dir / "all-MiniLM-L6-v2.fp16.onnx"
 
     if model_path.exists():
         print(f"✓ Model already exists at {model_path}")
+        if not optimized_path.exists():
+            optimize_model(model_path, optimized_path)
+        if not quantized_path.exists():
+            quantize_model(model_path, quantized_path)
+        if not fp16_path.exists():
+            convert_model_fp16(model_path, fp16_path)
         return
 
     # Create directory if it doesn't exist
@@ -44,6 +100,11 @@ def download_model():
             "https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2/tree/main/onnx"
         )
         print(f"And save as: {model_path}")
+        return
+
+    optimize_model(model_path, optimized_path)
+    quantize_model(model_path, quantized_path)
+    convert_model_fp16(model_path, fp16_path)
 
 
 if __name__ == "__main__":
@@ -26,9 +26,6 @@ def migrate_database():
     cursor = conn.cursor()
     
     try:
-        # Start transaction
-        conn.execute("BEGIN TRANSACTION")
-        
         # Check if columns already exist
         columns_to_add = []
         
@@ -41,56 +38,29 @@ def migrate_database():
         if not check_column_exists(cursor, "entities", "embedding_generated_at"):
             columns_to_add.append(("embedding_generated_at", "TIMESTAMP"))
         
-        # Add missing columns
+        # Build all DDL into one script so SQLite applies it in a single
+        # transaction. IF NOT EXISTS replaces the sqlite_master probes.
+        ddl = ["BEGIN;"]
+        ddl.extend(
+            f"ALTER TABLE entities ADD COLUMN {column_name} {column_type};"
+            for column_name, column_type in columns_to_add
+        )
+        ddl.extend([
+            "CREATE INDEX IF NOT EXISTS idx_entities_normalized_name ON entities(normalized_name);",
+            "CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(type);",
+            "CREATE INDEX IF NOT EXISTS idx_entities_last_updated ON entities(last_updated);",
+            "COMMIT;",
+        ])
+        conn.executescript("\n".join(ddl))
+        
         if columns_to_add:
-            print(f"Adding {len(columns_to_add)} new columns to entities table...")
-            
-            for column_name, column_type in columns_to_add:
-                sql = f"ALTER TABLE entities ADD COLUMN {column_name} {column_type}"
-                cursor.execute(sql)
+            print(f"Added {len(columns_to_add)} new columns to entities table...")
+            for column_name, _ in columns_to_add:
                 print(f"✓ Added column: {column_name}")
         else:
             print("✓ All embedding columns already exist")
+        print("✓ Ensured indexes: idx_entities_normalized_name, idx_entities_type, idx_entities_last_updated")
         
-        # Check and create indexes if they don't exist
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='index' AND name='idx_entities_normalized_name'
-        """)
-        
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE INDEX idx_entities_normalized_name 
-                ON entities(normalized_name)
-            """)
-            print("✓ Created index: idx_entities_normalized_name")
-        
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='index' AND name='idx_entities_type'
-        """)
-        
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE INDEX idx_entities_type 
-                ON entities(type)
-            """)
-            print("✓ Created index: idx_entities_type")
-        
-        cursor.execute("""
-            SELECT name FROM sqlite_master 
-            WHERE type='index' AND name='idx_entities_last_updated'
-        """)
-        
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE INDEX idx_entities_last_updated 
-                ON entities(last_updated)
-            """)
-            print("✓ Created index: idx_entities_last_updated")
-        
-        # Commit transaction
-        conn.commit()
         print("\n✓ Database migration completed successfully!")
         
         # Show statistics
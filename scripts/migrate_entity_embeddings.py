@@ -3,12 +3,13 @@
 Migrate entity embeddings from SQLite BLOBs to Qdrant vector database.
 
 This script:
-1. Backs up existing embeddings to JSON
-2. Reads embeddings from SQLite
+1. Backs up existing embeddings to .npz (vectors) + a small JSON manifest
+2. Reads embeddings from SQLite (or from an existing backup via --from-backup)
 3. Saves them to Qdrant
 4. Verifies the migration
 """
 
+import argparse
 import json
 import sqlite3
 import numpy as np
@@ -24,15 +25,31 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows pulled from SQLite per fetchmany() call during large scans
+STREAM_BATCH_SIZE = 4096
 
-def backup_embeddings(db_path: str, backup_file: str = "entity_embeddings_backup.json"):
-    """Backup all entity embeddings to JSON file."""
+DEFAULT_BACKUP_FILE = "entity_embeddings_backup.npz"
+
+
+def _manifest_path(backup_file: str) -> Path:
+    """entity_embeddings_backup.npz -> entity_embeddings_backup.meta.json"""
+    return Path(backup_file).with_suffix(".meta.json")
+
+
+def backup_embeddings(storage: MemoryStorage, backup_file: str = DEFAULT_BACKUP_FILE):
+    """Backup all entity embeddings to an .npz file plus a JSON manifest.
+    
+    Vectors are stored as one float32 matrix; everything else (names, models,
+    timestamps) goes in the manifest. This avoids repr()-ing every float into
+    pretty-printed JSON.
+    """
     logger.info(f"Backing up embeddings to {backup_file}")
     
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+    # Reuse the storage connection rather than opening a second one on the same file
+    cursor = storage.raw_conn().cursor()
+    cursor.row_factory = sqlite3.Row
     
+    cursor.arraysize = STREAM_BATCH_SIZE
     cursor.execute("""
         SELECT id, name, name_embedding, embedding_model, embedding_generated_at
         FROM entities
@@ -42,63 +59,127 @@ def backup_embeddings(db_path: str, backup_file: str = "entity_embeddings_backup
     embeddings = {}
     count = 0
     
-    for row in cursor.fetchall():
-        try:
-            # Deserialize embedding
-            embedding_bytes = row['name_embedding']
-            embedding = np.frombuffer(embedding_bytes, dtype=np.float32)
-            
-            embeddings[row['id']] = {
-                'name': row['name'],
-                'embedding': embedding.tolist(),
-                'model': row['embedding_model'],
-                'generated_at': row['embedding_generated_at']
-            }
-            count += 1
-        except Exception as e:
-            logger.error(f"Failed to backup embedding for entity {row['id']}: {e}")
+    # Stream the scan in bounded batches instead of fetchall(), so the raw
+    # BLOB rows never all sit in memory alongside the decoded embeddings
+    while True:
+        rows = cursor.fetchmany()
+        if not rows:
+            break
+        
+        for row in rows:
+            try:
+                # Deserialize embedding
+                embedding_bytes = row['name_embedding']
+                embedding = np.frombuffer(embedding_bytes, dtype=np.float32)
+                
+                embeddings[row['id']] = {
+                    'name': row['name'],
+                    'embedding': embedding,
+                    'model': row['embedding_model'],
+                    'generated_at': row['embedding_generated_at']
+                }
+                count += 1
+            except Exception as e:
+                logger.error(f"Failed to backup embedding for entity {row['id']}: {e}")
+    
+    cursor.close()
     
-    conn.close()
+    ids = list(embeddings.keys())
+    matrix = (
+        np.stack([embeddings[entity_id]['embedding'] for entity_id in ids]).astype(np.float32)
+        if ids else np.zeros((0, 384), dtype=np.float32)
+    )
+    np.savez_compressed(backup_file, ids=np.array(ids, dtype=str), embeddings=matrix)
     
-    with open(backup_file, 'w') as f:
+    with open(_manifest_path(backup_file), 'w') as f:
         json.dump({
             'backup_date': datetime.now().isoformat(),
             'total_embeddings': count,
-            'embeddings': embeddings
-        }, f, indent=2)
+            'names': [embeddings[entity_id]['name'] for entity_id in ids],
+            'models': [embeddings[entity_id]['model'] for entity_id in ids],
+            'generated_at': [embeddings[entity_id]['generated_at'] for entity_id in ids]
+        }, f)
     
     logger.info(f"Backed up {count} embeddings")
     return embeddings
 
 
-def migrate_embeddings(storage: MemoryStorage, embeddings: dict):
-    """Migrate embeddings to Qdrant."""
+def load_embeddings_backup(backup_file: str) -> dict:
+    """Load a backup written by backup_embeddings.
+    
+    Accepts both the current .npz + .meta.json pair and the legacy
+    single-file JSON format, so older backups can still be migrated.
+    """
+    if backup_file.endswith(".json") and not backup_file.endswith(".meta.json"):
+        with open(backup_file) as f:
+            legacy = json.load(f)
+        return {
+            entity_id: {**data, 'embedding': np.asarray(data['embedding'], dtype=np.float32)}
+            for entity_id, data in legacy.get('embeddings', {}).items()
+        }
+    
+    with np.load(backup_file) as archive:
+        ids = archive['ids'].tolist()
+        matrix = archive['embeddings']
+    with open(_manifest_path(backup_file)) as f:
+        manifest = json.load(f)
+    
+    return {
+        entity_id: {
+            'name': manifest['names'][i],
+            'embedding': matrix[i],
+            'model': manifest['models'][i],
+            'generated_at': manifest['generated_at'][i]
+        }
+        for i, entity_id in enumerate(ids)
+    }
+
+
+def migrate_embeddings(storage: MemoryStorage, embeddings: dict, batch_size: int = 256):
+    """Migrate embeddings to Qdrant.
+    
+    Points are upserted in batches; each batch is then confirmed with a single
+    id-only retrieve. Full vector comparison is left to verify_migration's
+    random sample.
+    """
     logger.info(f"Starting migration of {len(embeddings)} embeddings to Qdrant")
     
     success_count = 0
     failed_ids = []
+    entity_ids = list(embeddings.keys())
     
-    for entity_id, data in embeddings.items():
+    for start in range(0, len(entity_ids), batch_size):
+        batch_ids = entity_ids[start:start + batch_size]
         try:
-            # Convert list back to numpy array
-            embedding = np.array(data['embedding'], dtype=np.float32)
+            batch_vectors = [
+                np.asarray(embeddings[entity_id]['embedding'], dtype=np.float32)
+                for entity_id in batch_ids
+            ]
             
             # Save to Qdrant
-            storage.save_entity_embedding(entity_id, embedding)
+            storage.save_entity_embeddings_batch(batch_ids, batch_vectors)
+            
+            # Confirm presence only - no vectors over the wire
+            points = storage.qdrant.retrieve(
+                collection_name=settings.qdrant_entity_collection,
+                ids=batch_ids,
+                with_vectors=False,
+                with_payload=False
+            )
+            present = {str(point.id) for point in points}
             
-            # Verify it was saved
-            retrieved = storage.get_entity_embedding(entity_id)
-            if retrieved is not None:
-                success_count += 1
-                if success_count % 100 == 0:
-                    logger.info(f"Migrated {success_count} embeddings...")
-            else:
-                logger.error(f"Failed to verify embedding for {entity_id}")
-                failed_ids.append(entity_id)
+            for entity_id in batch_ids:
+                if entity_id in present:
+                    success_count += 1
+                else:
+                    logger.error(f"Failed to verify embedding for {entity_id}")
+                    failed_ids.append(entity_id)
+            
+            logger.info(f"Migrated {success_count} embeddings...")
                 
         except Exception as e:
-            logger.error(f"Failed to migrate {entity_id}: {e}")
-            failed_ids.append(entity_id)
+            logger.error(f"Failed to migrate batch starting at {batch_ids[0]}: {e}")
+            failed_ids.extend(batch_ids)
     
     logger.info(f"Migration complete: {success_count}/{len(embeddings)} successful")
     if failed_ids:
@@ -115,15 +196,32 @@ def verify_migration(storage: MemoryStorage, original_embeddings: dict, sample_s
     sample_ids = random.sample(list(original_embeddings.keys()), 
                               min(sample_size, len(original_embeddings)))
     
-    mismatches = []
-    for entity_id in sample_ids:
-        original = np.array(original_embeddings[entity_id]['embedding'])
-        retrieved = storage.get_entity_embedding(entity_id)
-        
-        if retrieved is None:
-            mismatches.append((entity_id, "Not found in Qdrant"))
-        elif not np.allclose(original, retrieved, rtol=1e-5):
-            mismatches.append((entity_id, "Embedding values don't match"))
+    # One batch retrieve for the whole sample instead of a call per entity
+    points = storage.qdrant.retrieve(
+        collection_name=settings.qdrant_entity_collection,
+        ids=sample_ids,
+        with_vectors=True,
+        with_payload=True
+    )
+    retrieved = {p.payload["entity_id"]: p.vector for p in points}
+    
+    mismatches = [(entity_id, "Not found in Qdrant")
+                  for entity_id in sample_ids if entity_id not in retrieved]
+    found_ids = [entity_id for entity_id in sample_ids if entity_id in retrieved]
+    
+    if found_ids:
+        # Compare the whole sample as (S, D) matrices in a single reduction
+        original = np.stack([
+            np.asarray(original_embeddings[entity_id]['embedding'], dtype=np.float32)
+            for entity_id in found_ids
+        ])
+        stored = np.array([retrieved[entity_id] for entity_id in found_ids],
+                          dtype=np.float32)
+        mismatch_mask = ~np.isclose(original, stored, rtol=1e-5).all(axis=1)
+        mismatches.extend(
+            (found_ids[i], "Embedding values don't match")
+            for i in np.flatnonzero(mismatch_mask)
+        )
     
     if mismatches:
         logger.error(f"Verification failed for {len(mismatches)} samples: {mismatches}")
@@ -135,13 +233,25 @@ def verify_migration(storage: MemoryStorage, original_embeddings: dict, sample_s
 
 def main():
     """Main migration process."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--from-backup",
+        help="Migrate from an existing backup (.npz or legacy .json) instead of SQLite"
+    )
+    args = parser.parse_args()
+    
     logger.info("Starting entity embeddings migration to Qdrant")
     
     # Initialize storage
     storage = MemoryStorage()
     
-    # Step 1: Backup
-    embeddings = backup_embeddings(settings.database_path)
+    # Step 1: Backup (or load a previous one)
+    if args.from_backup:
+        embeddings = load_embeddings_backup(args.from_backup)
+        backup_file = args.from_backup
+    else:
+        backup_file = DEFAULT_BACKUP_FILE
+        embeddings = backup_embeddings(storage, backup_file)
     
     if not embeddings:
         logger.warning("No embeddings found to migrate")
@@ -160,7 +270,7 @@ Migration Summary:
 - Total embeddings: {len(embeddings)}
 - Successfully migrated: {success_count}
 - Failed: {len(failed_ids)}
-- Backup saved to: entity_embeddings_backup.json
+- Backup saved to: {backup_file}
 
 Next steps:
 1. If migration was successful, update the code to remove SQLite embedding columns
@@ -35,14 +35,20 @@ def setup_database():
 
 
 def check_model():
-    """Check if ONNX model exists."""
-    model_path = Path(settings.onnx_model_path)
-    if not model_path.exists():
-        print(f"\n⚠ ONNX model not found at: {model_path}")
+    """Check if the raw and optimized ONNX models exist."""
+    ok = True
+    for model_path in (
+        Path(settings.onnx_raw_model_path),
+        Path(settings.onnx_model_path),
+    ):
+        if not model_path.exists():
+            print(f"\n⚠ ONNX model not found at: {model_path}")
+            ok = False
+        else:
+            print(f"✓ ONNX model found at: {model_path}")
+    if not ok:
         print("Run: python scripts/download_model.py")
-        return False
-    print(f"✓ ONNX model found at: {model_path}")
-    return True
+    return ok
 
 
 def check_env():
@@ -14,31 +14,263 @@ Usage:
     
     # Search memories
     results = client.search("API optimization")
+
+    # Ask many questions concurrently
+    async with AsyncSmartMeetClient() as client:
+        answers = await client.ask_many(["Who owns payments?", "Any blockers?"])
 """
 
+import asyncio
+import json
+import os
+import time
+
+import httpx
+import orjson
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote, unquote
+from typing import ClassVar, List, Dict, Any, Optional
 from datetime import datetime
 
 
+def _report_ingest(title: str, response) -> Dict[str, Any]:
+    """Print and return the result of an ingest call."""
+    if response.status_code == 200:
+        data = response.json()
+        print(f"✅ Ingested '{title}':")
+        print(f"   - {data['memory_count']} memories extracted")
+        print(f"   - {data['entity_count']} entities tracked")
+        print(f"   - {len(data['decisions'])} decisions identified")
+        return data
+    else:
+        print(f"❌ Failed to ingest: {response.text}")
+        return {}
+
+
+def _report_answer(question: str, response) -> str:
+    """Print and return the answer from a query call."""
+    if response.status_code == 200:
+        data = response.json()
+        confidence = data["confidence"]
+        answer = data["answer"]
+
+        print(f"❓ {question}")
+        print(f"💡 {answer}")
+        print(f"📊 Confidence: {confidence:.0%}")
+
+        return answer
+    else:
+        print(f"❌ Query failed: {response.text}")
+        return "Unable to answer question."
+
+
+def _report_search(query: str, response) -> List[Dict[str, Any]]:
+    """Print and return the results of a search call."""
+    if response.status_code == 200:
+        data = response.json()
+        results = data["results"]
+
+        print(f"🔍 Found {len(results)} results for '{query}':")
+        for i, result in enumerate(results, 1):
+            memory = result["memory"]
+            print(f"\n{i}. {memory['content']}")
+            if memory["speaker"]:
+                print(f"   Speaker: {memory['speaker']}")
+            print(f"   Score: {result['score']:.2f}")
+
+        return results
+    else:
+        print(f"❌ Search failed: {response.text}")
+        return []
+
+
+class _InProcessResponse:
+    """Minimal stand-in for requests.Response returned by the in-process transport."""
+
+    def __init__(self, status_code: int, data: Any):
+        self.status_code = status_code
+        self._data = data
+
+    def json(self) -> Any:
+        return self._data
+
+    @property
+    def text(self) -> str:
+        return json.dumps(self._data, default=str)
+
+
 class SmartMeetClient:
     """Simple client for Smart-Meet Lite API."""
 
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        """Initialize client with API base URL."""
+    # base_url -> monotonic time of the last successful health check
+    _health_cache: ClassVar[Dict[str, float]] = {}
+    HEALTH_CHECK_TTL = 60
+    MAX_ATTEMPTS = 3
+    RETRY_STATUSES = (502, 503, 504)
+    REQUEST_TIMEOUT = 30
+    # Bound the connect, never the read: LLM extraction can run for minutes,
+    # and the server commits the meeting even if the client gave up
+    INGEST_TIMEOUT = (30, None)
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        check: bool = True,
+        transport: str = "http",
+    ):
+        """
+        Initialize client with API base URL.
+
+        Args:
+            base_url: API base URL
+            check: Ping the API on creation (skipped if it answered recently)
+            transport: "http" (default) or "inproc" to import src.api and call
+                the endpoint functions directly, skipping network and ASGI
+        """
+        if transport not in ("http", "inproc"):
+            raise ValueError(f"Unknown transport: {transport}")
+
         self.base_url = base_url
-        self._check_connection()
+        self.transport = transport
+        self._api = None
+
+        # Reuse pooled keep-alive connections across calls; retries live in _request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"Connection": "keep-alive"})
+
+        if transport == "inproc":
+            # Loads storage, embeddings and LLM clients into this process
+            from src import api
+
+            self._api = api
+            # One loop for the client's lifetime: the API's async LLM client
+            # pools connections bound to the loop that opened them
+            self._loop = asyncio.new_event_loop()
+        elif check:
+            self._check_connection()
 
     def _check_connection(self):
         """Check if API is reachable."""
+        last_ok = self._health_cache.get(self.base_url)
+        if last_ok is not None and time.monotonic() - last_ok < self.HEALTH_CHECK_TTL:
+            return
+
         try:
-            response = requests.get(f"{self.base_url}/")
-            if response.status_code != 200:
+            response = self.session.get(f"{self.base_url}/")
+            if response.status_code == 200:
+                self._health_cache[self.base_url] = time.monotonic()
+            else:
                 print(f"⚠️  Warning: API returned status {response.status_code}")
         except requests.exceptions.ConnectionError:
             print("❌ Cannot connect to API. Make sure it's running:")
             print("   python -m src.api")
 
+    def _call(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        retry: bool = True,
+        timeout: Optional[Any] = None,
+    ):
+        """Issue one API call over the configured transport."""
+        if self.transport == "inproc":
+            return self._call_inproc(method, path, json or {}, params or {})
+        return self._request(
+            method, path, json=json, params=params, retry=retry, timeout=timeout
+        )
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        retry: bool = True,
+        timeout: Optional[Any] = None,
+    ) -> requests.Response:
+        """
+        Send an HTTP request with orjson-encoded body and retry/backoff.
+
+        Gateway errors (502/503/504) and dropped connections are retried up
+        to MAX_ATTEMPTS times with exponential backoff. Pass retry=False for
+        calls that must not be replayed, such as ingestion. timeout defaults
+        to REQUEST_TIMEOUT.
+        """
+        attempts = self.MAX_ATTEMPTS if retry else 1
+        body = orjson.dumps(json) if json is not None else None
+        headers = {"Content-Type": "application/json"} if body is not None else None
+
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = self.session.request(
+                    method,
+                    f"{self.base_url}{path}",
+                    data=body,
+                    headers=headers,
+                    params=params,
+                    timeout=timeout or self.REQUEST_TIMEOUT,
+                )
+            except requests.exceptions.ConnectionError:
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in self.RETRY_STATUSES or last_attempt:
+                    return response
+            time.sleep(0.5 * 2**attempt)
+
+    def _call_inproc(
+        self, method: str, path: str, payload: Dict[str, Any], params: Dict[str, Any]
+    ) -> _InProcessResponse:
+        """Dispatch a call straight to the matching endpoint coroutine in src.api."""
+        from fastapi import HTTPException, Response
+        from fastapi.encoders import jsonable_encoder
+
+        api = self._api
+        parts = path.strip("/").split("/")
+
+        if method == "POST" and path == "/api/ingest":
+            coro = api.ingest_meeting(api.IngestRequest(**payload))
+        elif method == "POST" and path == "/api/ingest/batch":
+            coro = api.ingest_batch(api.BatchIngestRequest(**payload))
+        elif method == "POST" and path == "/api/query":
+            coro = api.business_intelligence_query(api.BIQueryRequest(**payload))
+        elif method == "POST" and path == "/api/search":
+            coro = api.search_memories(api.SearchRequest(**payload))
+        elif method == "GET" and path == "/api/entities":
+            coro = api.list_entities(
+                entity_type=params.get("entity_type"), search=params.get("search")
+            )
+        elif method == "GET" and path == "/api/entities/facets":
+            coro = api.get_entity_facets()
+        elif method == "GET" and parts[:3] == ["api", "entities", "by-name"] and parts[-1] == "timeline":
+            coro = api.get_entity_timeline_by_name(unquote("/".join(parts[3:-1])))
+        elif method == "GET" and parts[:2] == ["api", "entities"] and parts[-1] == "timeline":
+            coro = api.get_entity_timeline(parts[2])
+        elif method == "GET" and parts[:2] == ["api", "analytics"]:
+            coro = api.get_analytics(parts[2], start_date=None, end_date=None)
+        else:
+            return _InProcessResponse(
+                501, {"detail": f"{method} {path} is not available in-process"}
+            )
+
+        try:
+            result = self._loop.run_until_complete(coro)
+        except HTTPException as e:
+            return _InProcessResponse(e.status_code, {"detail": e.detail})
+        if isinstance(result, Response):
+            # List endpoints return prebuilt JSON bytes
+            return _InProcessResponse(result.status_code, orjson.loads(result.body))
+        # Same plain-JSON shapes the HTTP transport would return
+        return _InProcessResponse(200, jsonable_encoder(result))
+
     def ingest_meeting(
         self, title: str, transcript: str, date: Optional[datetime] = None
     ) -> Dict[str, Any]:
@@ -57,17 +289,45 @@ class SmartMeetClient:
         if date:
             payload["date"] = date.isoformat()
 
-        response = requests.post(f"{self.base_url}/api/ingest", json=payload)
+        response = self._call(
+            "POST", "/api/ingest", json=payload, retry=False, timeout=self.INGEST_TIMEOUT
+        )
+        return _report_ingest(title, response)
+
+    def ingest_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Ingest several meeting transcripts in one request.
+
+        Args:
+            items: Dicts with "title", "transcript" and optional "date" (datetime)
+
+        Returns:
+            Meeting data for each successfully ingested transcript
+        """
+        payload_items = []
+        for item in items:
+            payload_item = {"title": item["title"], "transcript": item["transcript"]}
+            if item.get("date"):
+                payload_item["date"] = item["date"].isoformat()
+            payload_items.append(payload_item)
+
+        response = self._call(
+            "POST",
+            "/api/ingest/batch",
+            json={"items": payload_items},
+            retry=False,
+            timeout=self.INGEST_TIMEOUT,
+        )
+
         if response.status_code == 200:
             data = response.json()
-            print(f"✅ Ingested '{title}':")
-            print(f"   - {data['memory_count']} memories extracted")
-            print(f"   - {data['entity_count']} entities tracked")
-            print(f"   - {len(data['decisions'])} decisions identified")
-            return data
+            print(f"✅ Ingested {data['count']} of {len(items)} meetings")
+            for failure in data["failed"]:
+                print(f"   ❌ {failure['title']}: {failure['error']}")
+            return data["meetings"]
         else:
-            print(f"❌ Failed to ingest: {response.text}")
-            return {}
+            print(f"❌ Failed to ingest batch: {response.text}")
+            return []
 
     def ingest_file(
         self, file_path: str, title: Optional[str] = None
@@ -83,12 +343,29 @@ class SmartMeetClient:
             Meeting data
         """
         with open(file_path, "r", encoding="utf-8") as f:
-            files = {"file": f}
-            data = {"title": title} if title else {}
+            if self.transport == "inproc":
+                # No multipart upload in-process; derive the title like the server
+                if not title:
+                    title = (
+                        os.path.basename(file_path)
+                        .replace(".txt", "")
+                        .replace("_", " ")
+                        .title()
+                    )
+                response = self._call(
+                    "POST",
+                    "/api/ingest",
+                    json={"title": title, "transcript": f.read()},
+                    retry=False,
+                    timeout=self.INGEST_TIMEOUT,
+                )
+            else:
+                files = {"file": f}
+                data = {"title": title} if title else {}
 
-            response = requests.post(
-                f"{self.base_url}/api/ingest/file", files=files, data=data
-            )
+                response = self.session.post(
+                    f"{self.base_url}/api/ingest/file", files=files, data=data
+                )
 
             if response.status_code == 200:
                 result = response.json()
@@ -108,21 +385,9 @@ class SmartMeetClient:
         Returns:
             Answer string
         """
-        response = requests.post(f"{self.base_url}/api/query", json={"query": question})
-
-        if response.status_code == 200:
-            data = response.json()
-            confidence = data["confidence"]
-            answer = data["answer"]
-
-            print(f"❓ {question}")
-            print(f"💡 {answer}")
-            print(f"📊 Confidence: {confidence:.0%}")
+        response = self._call("POST", "/api/query", json={"query": question})
 
-            return answer
-        else:
-            print(f"❌ Query failed: {response.text}")
-            return "Unable to answer question."
+        return _report_answer(question, response)
 
     def search(
         self, query: str, limit: int = 5, entity_filter: Optional[List[str]] = None
@@ -142,24 +407,9 @@ class SmartMeetClient:
         if entity_filter:
             payload["entity_filter"] = entity_filter
 
-        response = requests.post(f"{self.base_url}/api/search", json=payload)
+        response = self._call("POST", "/api/search", json=payload)
 
-        if response.status_code == 200:
-            data = response.json()
-            results = data["results"]
-
-            print(f"🔍 Found {len(results)} results for '{query}':")
-            for i, result in enumerate(results, 1):
-                memory = result["memory"]
-                print(f"\n{i}. {memory['content']}")
-                if memory["speaker"]:
-                    print(f"   Speaker: {memory['speaker']}")
-                print(f"   Score: {result['score']:.2f}")
-
-            return results
-        else:
-            print(f"❌ Search failed: {response.text}")
-            return []
+        return _report_search(query, response)
 
     def list_entities(
         self, entity_type: Optional[str] = None, search: Optional[str] = None
@@ -180,7 +430,7 @@ class SmartMeetClient:
         if search:
             params["search"] = search
 
-        response = requests.get(f"{self.base_url}/api/entities", params=params)
+        response = self._call("GET", "/api/entities", params=params)
 
         if response.status_code == 200:
             entities = response.json()
@@ -207,6 +457,27 @@ class SmartMeetClient:
             print(f"❌ Failed to list entities: {response.text}")
             return []
 
+    def entity_facets(self) -> Dict[str, int]:
+        """
+        Get entity counts per type.
+
+        Returns:
+            Mapping of entity type to count
+        """
+        response = self._call("GET", "/api/entities/facets")
+
+        if response.status_code == 200:
+            data = response.json()
+
+            print(f"📋 {data['total']} entities tracked:")
+            for entity_type, count in sorted(data["by_type"].items()):
+                print(f"  {entity_type}: {count}")
+
+            return data["by_type"]
+        else:
+            print(f"❌ Failed to get entity facets: {response.text}")
+            return {}
+
     def get_timeline(self, entity_name: str) -> List[Dict[str, Any]]:
         """
         Get timeline for an entity.
@@ -217,20 +488,15 @@ class SmartMeetClient:
         Returns:
             Timeline of state changes
         """
-        # First, find the entity
-        entities = requests.get(
-            f"{self.base_url}/api/entities", params={"search": entity_name}
-        ).json()
+        # Name resolution and timeline in a single round-trip
+        response = self._call(
+            "GET", f"/api/entities/by-name/{quote(entity_name)}/timeline"
+        )
 
-        if not entities:
+        if response.status_code == 404:
             print(f"❌ Entity '{entity_name}' not found")
             return []
 
-        entity_id = entities[0]["id"]
-
-        # Get timeline
-        response = requests.get(f"{self.base_url}/api/entities/{entity_id}/timeline")
-
         if response.status_code == 200:
             data = response.json()
             timeline = data["timeline"]
@@ -257,7 +523,7 @@ class SmartMeetClient:
         Returns:
             Analytics data
         """
-        response = requests.get(f"{self.base_url}/api/analytics/{metric}")
+        response = self._call("GET", f"/api/analytics/{metric}")
 
         if response.status_code == 200:
             data = response.json()
@@ -331,6 +597,75 @@ Sarah: Perfect. This is high priority for our Q4 release.
             print("\nTry asking your own questions with: client.ask('your question')")
 
 
+class AsyncSmartMeetClient:
+    """
+    Async client for Smart-Meet Lite API.
+
+    Backed by a pooled HTTP/2 httpx.AsyncClient so many questions can be in
+    flight at once - server-side LLM latency overlaps instead of adding up.
+
+    Usage:
+        async with AsyncSmartMeetClient() as client:
+            answers = await client.ask_many(["Who owns payments?", "Any blockers?"])
+    """
+
+    def __init__(self, base_url: str = "http://localhost:8000", timeout: float = 30):
+        """Initialize client with API base URL."""
+        self.base_url = base_url
+        # Ingestion keeps the connect timeout but may read for as long as
+        # extraction takes (see SmartMeetClient.INGEST_TIMEOUT)
+        self._ingest_timeout = httpx.Timeout(timeout, read=None)
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=timeout,
+        )
+
+    async def __aenter__(self) -> "AsyncSmartMeetClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close pooled connections."""
+        await self._client.aclose()
+
+    async def ingest_meeting(
+        self, title: str, transcript: str, date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """Ingest a meeting transcript. See SmartMeetClient.ingest_meeting."""
+        payload = {"title": title, "transcript": transcript}
+        if date:
+            payload["date"] = date.isoformat()
+
+        response = await self._client.post(
+            "/api/ingest", json=payload, timeout=self._ingest_timeout
+        )
+        return _report_ingest(title, response)
+
+    async def ask(self, question: str) -> str:
+        """Ask a business intelligence question. See SmartMeetClient.ask."""
+        response = await self._client.post("/api/query", json={"query": question})
+        return _report_answer(question, response)
+
+    async def ask_many(self, questions: List[str]) -> List[str]:
+        """Ask several questions concurrently; answers keep the input order."""
+        return await asyncio.gather(*(self.ask(q) for q in questions))
+
+    async def search(
+        self, query: str, limit: int = 5, entity_filter: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Search for relevant memories. See SmartMeetClient.search."""
+        payload = {"query": query, "limit": limit}
+        if entity_filter:
+            payload["entity_filter"] = entity_filter
+
+        response = await self._client.post("/api/search", json=payload)
+        return _report_search(query, response)
+
+
 # Convenience functions for quick usage
 def quick_start():
     """Quick start guide."""
@@ -358,6 +693,7 @@ Smart-Meet Lite Client - Quick Start
 5. View entities:
    client.list_entities()
    client.list_entities(entity_type="project")
+   client.entity_facets()  # counts per type
    
 6. Get timeline:
    client.get_timeline("Payment API")
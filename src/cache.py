@@ -4,9 +4,13 @@ Prevents duplicate expensive API calls.
 """
 
 import time
-import json
 import hashlib
-from typing import Dict, Any, Optional
+import itertools
+import threading
+import pickle
+import orjson
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,21 +20,44 @@ class CacheLayer:
     """
     A simple in-memory cache with Time-To-Live (TTL) support.
     Used to cache expensive LLM operations and database queries.
+    
+    Bounded to max_size entries with least-recently-used eviction, so
+    high-cardinality keys can't grow the process without limit.
+    
+    Thread-safe: keys are spread over SHARDS independently locked
+    OrderedDicts, so concurrent callers rarely contend. LRU order and the
+    size cap are kept per shard. Hit/miss counters are unlocked telemetry
+    and may undercount slightly under contention.
     """
     
-    def __init__(self, default_ttl: int = 3600):
+    # Entries checked for expiry on each set
+    EVICTION_SAMPLE = 5
+    # Power of two so the shard index is a mask
+    SHARDS = 16
+    
+    def __init__(self, default_ttl: int = 3600, max_size: int = 10000):
         """
         Initialize cache with default TTL.
         
         Args:
             default_ttl: Default time-to-live in seconds (default: 1 hour)
+            max_size: Maximum number of entries before LRU eviction
         """
-        self._cache: Dict[str, Any] = {}
-        self._ttl: Dict[str, float] = {}
+        # key -> (expires_at, value), least recently used first; one dict
+        # means one probe per lookup
+        self._shards = [OrderedDict() for _ in range(self.SHARDS)]
+        self._locks = [threading.Lock() for _ in range(self.SHARDS)]
         self.default_ttl = default_ttl
+        self.max_size = max_size
+        self._shard_max_size = max(1, max_size // self.SHARDS)
         self._hits = 0
         self._misses = 0
         
+    def _shard(self, key: str) -> Tuple["OrderedDict[str, Tuple[float, Any]]", threading.Lock]:
+        """Return the shard dict and lock that own key."""
+        index = hash(key) & (self.SHARDS - 1)
+        return self._shards[index], self._locks[index]
+        
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache if it exists and hasn't expired.
@@ -41,17 +68,23 @@ class CacheLayer:
         Returns:
             Cached value if found and not expired, None otherwise
         """
-        if key in self._cache and time.time() < self._ttl[key]:
-            self._hits += 1
-            logger.debug(f"Cache hit for key: {key[:32]}...")
-            return self._cache[key]
-            
-        if key in self._cache:
+        store, lock = self._shard(key)
+        with lock:
+            try:
+                expires_at, value = store[key]
+            except KeyError:
+                self._misses += 1
+                return None
+                
+            if time.time() < expires_at:
+                store.move_to_end(key)
+                self._hits += 1
+                logger.debug(f"Cache hit for key: {key[:32]}...")
+                return value
+                
             # Expired - remove from cache
-            del self._cache[key]
-            del self._ttl[key]
-            logger.debug(f"Cache expired for key: {key[:32]}...")
-            
+            del store[key]
+        logger.debug(f"Cache expired for key: {key[:32]}...")
         self._misses += 1
         return None
         
@@ -64,28 +97,67 @@ class CacheLayer:
             value: Value to cache
             ttl: Time-to-live in seconds (uses default if not specified)
         """
-        self._cache[key] = value
-        self._ttl[key] = time.time() + (ttl or self.default_ttl)
+        now = time.time()
+        store, lock = self._shard(key)
+        with lock:
+            store[key] = (now + (ttl or self.default_ttl), value)
+            store.move_to_end(key)
+            
+            self._evict_expired(store, now)
+            if len(store) > self._shard_max_size:
+                store.popitem(last=False)
         logger.debug(f"Cached value for key: {key[:32]}... (TTL: {ttl or self.default_ttl}s)")
         
+    def _evict_expired(self, store: "OrderedDict[str, Tuple[float, Any]]", now: float):
+        """
+        Drop expired entries among a shard's least recently used few. Expired
+        keys that are never read again would otherwise sit until LRU eviction.
+        Caller holds the shard lock.
+        """
+        sample = itertools.islice(store.items(), self.EVICTION_SAMPLE)
+        for key in [key for key, (expires_at, _) in sample if expires_at <= now]:
+            del store[key]
+        
+    def invalidate_prefix(self, prefix: str) -> int:
+        """
+        Remove all entries whose key starts with prefix.
+        
+        Args:
+            prefix: Key prefix to invalidate
+            
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        for store, lock in zip(self._shards, self._locks):
+            with lock:
+                stale = [key for key in store if key.startswith(prefix)]
+                for key in stale:
+                    del store[key]
+            removed += len(stale)
+        if removed:
+            logger.debug(f"Invalidated {removed} cache entries with prefix: {prefix}")
+        return removed
+        
     def clear(self):
         """Clear all cached values."""
-        self._cache.clear()
-        self._ttl.clear()
+        for store, lock in zip(self._shards, self._locks):
+            with lock:
+                store.clear()
         self._hits = 0
         self._misses = 0
         logger.info("Cache cleared")
         
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        total_requests = self._hits + self._misses
-        hit_rate = self._hits / total_requests if total_requests > 0 else 0
+        hits, misses = self._hits, self._misses
+        total_requests = hits + misses
         
         return {
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate": hit_rate,
-            "size": len(self._cache),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (total_requests or 1),
+            "size": sum(len(store) for store in self._shards),
             "total_requests": total_requests
         }
         
@@ -98,7 +170,7 @@ class CacheLayer:
             **kwargs: Keyword arguments to include in key
             
         Returns:
-            MD5 hash of the combined arguments
+            BLAKE2b hash of the combined arguments
         """
         # Combine all arguments into a single structure
         key_data = {
@@ -106,8 +178,11 @@ class CacheLayer:
             "kwargs": kwargs
         }
         
-        # Convert to JSON for consistent serialization
-        key_str = json.dumps(key_data, sort_keys=True)
+        # Hash canonical bytes directly; no intermediate str or encode step
+        try:
+            key_bytes = orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # Not JSON-serializable; pickle is deterministic for the same values
+            key_bytes = pickle.dumps(key_data, protocol=5)
         
-        # Return MD5 hash for compact key
-        return hashlib.md5(key_str.encode()).hexdigest()
\ No newline at end of file
+        return hashlib.blake2b(key_bytes, digest_size=16).hexdigest()
@@ -1,5 +1,6 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 
 
@@ -9,6 +10,8 @@ class Settings(BaseSettings):
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
+    api_reload: bool = True  # Dev auto-reload; ignored with --prod
+    api_workers: int = 0  # --prod worker processes (0 = one per physical core)
 
     # Database
     database_path: str = "data/memories.db"
@@ -16,11 +19,20 @@ class Settings(BaseSettings):
     # Qdrant
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
+    qdrant_grpc_port: int = 6334
+    qdrant_prefer_grpc: bool = True  # Vectors travel as packed floats, not JSON text
+    qdrant_quantization: bool = True  # int8 scalar quantization on the memories collection
     qdrant_collection: str = "memories"
     qdrant_entity_collection: str = "entity_embeddings"
 
     # Model
-    onnx_model_path: str = "models/onnx/all-MiniLM-L6-v2.onnx"
+    onnx_model_path: str = "models/onnx/all-MiniLM-L6-v2.opt.onnx"  # ORT-optimized copy
+    onnx_raw_model_path: str = "models/onnx/all-MiniLM-L6-v2.onnx"
+    onnx_quantized_model_path: str = "models/onnx/all-MiniLM-L6-v2.int8.onnx"
+    onnx_quantize: bool = False  # Load the INT8 copy (vectors drift from stored FP32 ones)
+    onnx_fp16_model_path: str = "models/onnx/all-MiniLM-L6-v2.fp16.onnx"
+    onnx_fp16: bool = False  # Load FP16 weights instead (fast only on CPUs with native FP16)
+    onnx_intra_op_threads: int = 0  # ORT threads per session (0 = half the CPU count)
 
     # OpenRouter Configuration
     openrouter_api_key: str
@@ -33,6 +45,9 @@ class Settings(BaseSettings):
     
     # Query Engine
     timeline_display_limit: int = 10  # Number of timeline events to show in query results
+    semantic_cache_threshold: float = 0.93  # Cosine similarity for a paraphrase hit
+    semantic_cache_max_entries: int = 1024  # Least recently used answers are evicted past this
+    semantic_cache_ttl: int = 1800  # Seconds before a cached answer is recomputed
     
     # Entity Resolution
     entity_resolution_threshold: float = 0.6  # Lower than current 80%
@@ -49,9 +64,12 @@ class Settings(BaseSettings):
         env_file = ".env"
         case_sensitive = False
 
-    @property
+    @cached_property
     def clean_openrouter_model(self) -> str:
-        """Get openrouter_model with ALL formatting cleaned - handles comments and whitespace."""
+        """
+        Get openrouter_model with ALL formatting cleaned - handles comments and whitespace.
+        Parsed once per Settings instance; read on every LLM request.
+        """
         model = self.openrouter_model
         
         # Handle multiple comment styles
@@ -79,5 +97,11 @@ class Settings(BaseSettings):
         return model
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment only once."""
+    return Settings()
+
+
+# Global settings instance (same object as get_settings())
+settings = get_settings()
@@ -2,9 +2,13 @@
 Consultant-specific query engine that understands workstreams, hierarchies, and synthesis.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable
 from datetime import datetime, timedelta
 import logging
+import re
+from functools import lru_cache
+from itertools import groupby
+from concurrent.futures import ThreadPoolExecutor
 
 from src.storage import MemoryStorage
 from src.embeddings import EmbeddingEngine
@@ -12,10 +16,22 @@ from src.entity_resolver import EntityResolver
 from src.meeting_synthesis import MeetingSynthesizer
 from src.entity_hierarchy import EntityHierarchyManager
 from src.models import BIQueryResult, QueryIntent
+from src.cache import CacheLayer
 
 logger = logging.getLogger(__name__)
 
 
+def _phrase_pattern(phrases: Iterable[str]) -> re.Pattern:
+    """Compile lowercase phrases into one substring alternation (match against lowered text)."""
+    return re.compile("|".join(map(re.escape, phrases)))
+
+
+@lru_cache(maxsize=32)
+def _tree_prefix(indent: int) -> str:
+    """Line prefix for a node at the given tree depth."""
+    return "  " * indent + ("└─ " if indent > 0 else "")
+
+
 class ConsultantQueryEngine:
     """Query engine optimized for consultant use cases."""
     
@@ -25,64 +41,104 @@ class ConsultantQueryEngine:
         'standard_costing': ['standard cost', 'costing', 'cost model']
     }
     
+    # Single-word names and aliases resolve with one dict probe per query token;
+    # only multiword aliases need a phrase scan
+    _ALIAS_TO_WORKSTREAM = {
+        alias: workstream
+        for workstream, aliases in WORKSTREAM_ALIASES.items()
+        for alias in [workstream, *aliases]
+        if ' ' not in alias
+    }
+    _MULTIWORD_PATTERNS = [
+        (workstream, _phrase_pattern([alias for alias in aliases if ' ' in alias]))
+        for workstream, aliases in WORKSTREAM_ALIASES.items()
+        if any(' ' in alias for alias in aliases)
+    ]
+    _TOKEN_RE = re.compile(r'\w+')
+    
+    # Matchers compiled once; each .search() scans the query in C instead of
+    # looping over phrases in Python
+    _STATUS_RE = _phrase_pattern(['status of', 'how is', 'where are we with', 'update on'])
+    _CROSS_TEAM_RE = _phrase_pattern(['across teams', 'all teams', 'which teams', 'team coordination'])
+    _SYNTHESIS_RE = _phrase_pattern(['today', 'this week', 'all meetings', 'summary of', 'what happened'])
+    _HIERARCHY_RE = _phrase_pattern(['breakdown', 'all tasks', 'subtasks', 'dependencies', 'tree'])
+    _QUOTED_RE = re.compile(r'"([^"]+)"')
+    
     def __init__(
         self,
         storage: MemoryStorage,
         embeddings: EmbeddingEngine,
         entity_resolver: EntityResolver,
         synthesizer: MeetingSynthesizer,
-        hierarchy_manager: EntityHierarchyManager
+        hierarchy_manager: EntityHierarchyManager,
+        cache: Optional[CacheLayer] = None
     ):
         self.storage = storage
         self.embeddings = embeddings
         self.entity_resolver = entity_resolver
         self.synthesizer = synthesizer
         self.hierarchy = hierarchy_manager
+        # Syntheses are relative to "now", so keep them only briefly
+        self.cache = cache or CacheLayer(default_ttl=300)
         
     def process_query(self, query: str) -> BIQueryResult:
         """Process consultant query with workstream awareness."""
         logger.info(f"Processing consultant query: {query}")
         
+        # Lowercase once for all matchers
+        query_lower = query.lower()
+        
         # Detect workstream context
-        workstream = self._detect_workstream(query)
+        workstream = self._detect_workstream(query, query_lower)
         
         # Classify intent with consultant patterns
-        intent = self._classify_consultant_intent(query, workstream)
+        intent = self._classify_consultant_intent(query, workstream, query_lower)
         
         # Route to appropriate handler
         if intent.intent_type == 'workstream_status':
-            return self._handle_workstream_status(query, workstream)
+            return self._handle_workstream_status(query, workstream, intent)
         elif intent.intent_type == 'cross_team':
-            return self._handle_cross_team_query(query, workstream)
+            return self._handle_cross_team_query(query, workstream, intent)
         elif intent.intent_type == 'synthesis':
-            return self._handle_synthesis_query(query, workstream)
+            return self._handle_synthesis_query(query, workstream, intent)
         elif intent.intent_type == 'hierarchy':
             return self._handle_hierarchy_query(query, intent)
         else:
             # Fall back to standard handling
             return self._handle_standard_query(query, intent)
     
-    def _detect_workstream(self, query: str) -> Optional[str]:
+    def _detect_workstream(self, query: str, query_lower: Optional[str] = None) -> Optional[str]:
         """Detect which workstream the query is about."""
-        query_lower = query.lower()
+        if query_lower is None:
+            query_lower = query.lower()
+        
+        alias_to_workstream = self._ALIAS_TO_WORKSTREAM
+        matched = {
+            alias_to_workstream[token]
+            for token in self._TOKEN_RE.findall(query_lower)
+            if token in alias_to_workstream
+        }
+        if matched:
+            # Several hits resolve in declaration order, so the first listed workstream wins
+            for workstream in self.WORKSTREAM_ALIASES:
+                if workstream in matched:
+                    return workstream
         
-        for workstream, aliases in self.WORKSTREAM_ALIASES.items():
-            if workstream in query_lower:
+        for workstream, pattern in self._MULTIWORD_PATTERNS:
+            if pattern.search(query_lower):
                 return workstream
-            for alias in aliases:
-                if alias in query_lower:
-                    return workstream
         
         return None
     
-    def _classify_consultant_intent(self, query: str, workstream: Optional[str]) -> QueryIntent:
+    def _classify_consultant_intent(
+        self, query: str, workstream: Optional[str], query_lower: Optional[str] = None
+    ) -> QueryIntent:
         """Classify query intent with consultant-specific patterns."""
-        query_lower = query.lower()
+        if query_lower is None:
+            query_lower = query.lower()
         
         # Workstream status patterns
-        if any(phrase in query_lower for phrase in [
-            'status of', 'how is', 'where are we with', 'update on'
-        ]) and workstream:
+        if workstream and self._STATUS_RE.search(query_lower):
             return QueryIntent(
                 intent_type='workstream_status',
                 entities=[workstream],
@@ -90,9 +146,7 @@ class ConsultantQueryEngine:
             )
         
         # Cross-team coordination patterns
-        if any(phrase in query_lower for phrase in [
-            'across teams', 'all teams', 'which teams', 'team coordination'
-        ]):
+        if self._CROSS_TEAM_RE.search(query_lower):
             return QueryIntent(
                 intent_type='cross_team',
                 entities=[],
@@ -100,9 +154,7 @@ class ConsultantQueryEngine:
             )
         
         # Synthesis patterns (your 30 meetings problem)
-        if any(phrase in query_lower for phrase in [
-            'today', 'this week', 'all meetings', 'summary of', 'what happened'
-        ]):
+        if self._SYNTHESIS_RE.search(query_lower):
             return QueryIntent(
                 intent_type='synthesis',
                 entities=[],
@@ -110,9 +162,7 @@ class ConsultantQueryEngine:
             )
         
         # Hierarchy patterns
-        if any(phrase in query_lower for phrase in [
-            'breakdown', 'all tasks', 'subtasks', 'dependencies', 'tree'
-        ]):
+        if self._HIERARCHY_RE.search(query_lower):
             return QueryIntent(
                 intent_type='hierarchy',
                 entities=self._extract_entities(query),
@@ -122,43 +172,53 @@ class ConsultantQueryEngine:
         # Default classification
         return QueryIntent(intent_type='search', entities=[], filters={})
     
-    def _handle_workstream_status(self, query: str, workstream: str) -> BIQueryResult:
+    def _synthesize(self, workstream: str, time_window: timedelta = timedelta(days=1)) -> Dict[str, Any]:
+        """Synthesize workstream progress, reusing recent results for the same window."""
+        key = self.cache.make_key("synth", workstream, time_window.total_seconds())
+        synthesis = self.cache.get(key)
+        if synthesis is None:
+            synthesis = self.synthesizer.synthesize_workstream_progress(workstream, time_window)
+            self.cache.set(key, synthesis, ttl=300)
+        return synthesis
+    
+    def _handle_workstream_status(
+        self, query: str, workstream: str, intent: QueryIntent
+    ) -> BIQueryResult:
         """Handle workstream status queries."""
         # Get synthesis for the workstream
-        synthesis = self.synthesizer.synthesize_workstream_progress(
+        synthesis = self._synthesize(
             workstream,
             time_window=timedelta(days=1)  # Today's meetings
         )
         
         # Build comprehensive answer
         answer_parts = [synthesis['executive_summary']]
+        append = answer_parts.append
+        state_changes = synthesis['state_changes']
+        blockers = synthesis['blockers']
+        action_items = synthesis['action_items']
         
         # Add specific insights
-        if synthesis['state_changes']:
-            answer_parts.append(f"\nRecent progress:")
-            for change in synthesis['state_changes'][:5]:
-                answer_parts.append(f"• {change['entity']}: {change['change']}")
+        if state_changes:
+            append("\nRecent progress:")
+            for change in state_changes[:5]:
+                append(f"• {change['entity']}: {change['change']}")
         
-        if synthesis['blockers']:
-            answer_parts.append(f"\nCurrent blockers:")
-            for blocker in synthesis['blockers'][:3]:
-                answer_parts.append(f"• {blocker}")
+        if blockers:
+            append("\nCurrent blockers:")
+            for blocker in blockers[:3]:
+                append(f"• {blocker}")
         
-        if synthesis['action_items']:
-            answer_parts.append(f"\nAction items ({len(synthesis['action_items'])} total):")
-            for item in synthesis['action_items'][:3]:
-                assignee = item.get('assignee', 'Unassigned')
-                answer_parts.append(f"• {item['task']} ({assignee})")
+        if action_items:
+            append(f"\nAction items ({len(action_items)} total):")
+            for item in action_items[:3]:
+                append(f"• {item['task']} ({item.get('assignee', 'Unassigned')})")
         
         answer = "\n".join(answer_parts)
         
         return BIQueryResult(
             query=query,
-            intent=QueryIntent(
-                intent_type='workstream_status',
-                entities=[workstream],
-                filters={'workstream': workstream}
-            ),
+            intent=intent,
             answer=answer,
             confidence=0.85,
             evidence=synthesis,
@@ -168,11 +228,13 @@ class ConsultantQueryEngine:
             }
         )
     
-    def _handle_cross_team_query(self, query: str, workstream: Optional[str]) -> BIQueryResult:
+    def _handle_cross_team_query(
+        self, query: str, workstream: Optional[str], intent: QueryIntent
+    ) -> BIQueryResult:
         """Handle cross-team coordination queries."""
         # Get all teams involved in workstream
         if workstream:
-            synthesis = self.synthesizer.synthesize_workstream_progress(workstream)
+            synthesis = self._synthesize(workstream)
             teams = synthesis['teams_involved']
             
             # Get team-specific insights
@@ -187,15 +249,17 @@ class ConsultantQueryEngine:
                     'key_entities': self._get_team_entities(team, workstream)
                 })
             
-            answer = f"Cross-team coordination for {workstream}:\n\n"
+            parts = [f"Cross-team coordination for {workstream}:\n\n"]
             for insight in team_insights:
-                answer += f"**{insight['team']} Team:**\n"
-                answer += f"• Meetings: {insight['meeting_count']}\n"
-                answer += f"• Focus areas: {', '.join(insight['key_entities'][:3])}\n\n"
+                parts.append(f"**{insight['team']} Team:**\n")
+                parts.append(f"• Meetings: {insight['meeting_count']}\n")
+                parts.append(f"• Focus areas: {', '.join(insight['key_entities'][:3])}\n\n")
+            answer = "".join(parts)
             
+            intent.entities = list(teams)
             return BIQueryResult(
                 query=query,
-                intent=QueryIntent(intent_type='cross_team', entities=list(teams)),
+                intent=intent,
                 answer=answer,
                 confidence=0.8,
                 evidence={'team_insights': team_insights}
@@ -203,53 +267,63 @@ class ConsultantQueryEngine:
         
         return BIQueryResult(
             query=query,
-            intent=QueryIntent(intent_type='cross_team', entities=[]),
+            intent=intent,
             answer="Please specify a workstream for cross-team analysis.",
             confidence=0.3
         )
     
-    def _handle_synthesis_query(self, query: str, workstream: Optional[str]) -> BIQueryResult:
+    def _handle_synthesis_query(
+        self, query: str, workstream: Optional[str], intent: QueryIntent
+    ) -> BIQueryResult:
         """Handle synthesis queries (what happened today/this week)."""
         # Determine time window
-        if 'today' in query.lower():
+        query_lower = query.lower()
+        if 'today' in query_lower:
             time_window = timedelta(days=1)
-        elif 'week' in query.lower():
+        elif 'week' in query_lower:
             time_window = timedelta(days=7)
         else:
             time_window = timedelta(days=1)  # Default to today
         
         if workstream:
-            synthesis = self.synthesizer.synthesize_workstream_progress(workstream, time_window)
+            synthesis = self._synthesize(workstream, time_window)
         else:
             # Synthesize across all workstreams
             all_workstreams = ['uat', 'hypercare', 'standard_costing']
-            synthesis_results = []
             
-            for ws in all_workstreams:
-                ws_synthesis = self.synthesizer.synthesize_workstream_progress(ws, time_window)
-                if ws_synthesis['meeting_count'] > 0:
-                    synthesis_results.append((ws, ws_synthesis))
+            # Independent DB/LLM-bound syntheses; run them side by side
+            with ThreadPoolExecutor(max_workers=len(all_workstreams)) as executor:
+                syntheses = executor.map(
+                    lambda ws: self._synthesize(ws, time_window), all_workstreams
+                )
+                synthesis_results = [
+                    (ws, ws_synthesis)
+                    for ws, ws_synthesis in zip(all_workstreams, syntheses)
+                    if ws_synthesis['meeting_count'] > 0
+                ]
             
-            answer = f"Summary across all workstreams ({time_window.days} day(s)):\n\n"
+            parts = [f"Summary across all workstreams ({time_window.days} day(s)):\n\n"]
             for ws, syn in synthesis_results:
-                answer += f"**{ws.upper()}:**\n"
-                answer += f"• Meetings: {syn['meeting_count']}\n"
-                answer += f"• Teams: {', '.join(syn['teams_involved'])}\n"
+                parts.append(f"**{ws.upper()}:**\n")
+                parts.append(f"• Meetings: {syn['meeting_count']}\n")
+                parts.append(f"• Teams: {', '.join(syn['teams_involved'])}\n")
                 if syn['patterns']:
-                    answer += f"• Key pattern: {syn['patterns'][0]}\n"
-                answer += "\n"
+                    parts.append(f"• Key pattern: {syn['patterns'][0]}\n")
+                parts.append("\n")
+            answer = "".join(parts)
             
             return BIQueryResult(
                 query=query,
-                intent=QueryIntent(intent_type='synthesis', entities=[]),
+                intent=intent,
                 answer=answer,
                 confidence=0.9,
                 evidence={'all_syntheses': synthesis_results}
             )
         
+        intent.entities = [workstream]
         return BIQueryResult(
             query=query,
-            intent=QueryIntent(intent_type='synthesis', entities=[workstream] if workstream else []),
+            intent=intent,
             answer=synthesis['executive_summary'],
             confidence=0.85,
             evidence=synthesis
@@ -267,7 +341,7 @@ class ConsultantQueryEngine:
         
         # Get the main entity
         entity_name = intent.entities[0]
-        entities = self.storage.search_entities(entity_name)
+        entities = self.storage.search_entities(entity_name, limit=1)
         
         if not entities:
             return BIQueryResult(
@@ -283,15 +357,15 @@ class ConsultantQueryEngine:
         tree = self.hierarchy.get_entity_tree(entity.id)
         
         # Format as readable tree
-        answer = f"Hierarchy for {entity.name}:\n\n"
-        answer += self._format_tree(tree)
+        parts = [f"Hierarchy for {entity.name}:\n\n", self._format_tree(tree)]
         
         # Add related entities
         related = self.hierarchy.find_related_entities(entity.id)
         if related['parent']:
-            answer += f"\nReports to: {related['parent'][0].name}"
+            parts.append(f"\nReports to: {related['parent'][0].name}")
         if related['sibling']:
-            answer += f"\nPeer items: {', '.join([s.name for s in related['sibling'][:3]])}"
+            parts.append(f"\nPeer items: {', '.join([s.name for s in related['sibling'][:3]])}")
+        answer = "".join(parts)
         
         return BIQueryResult(
             query=query,
@@ -303,46 +377,30 @@ class ConsultantQueryEngine:
     
     def _format_tree(self, node: Dict[str, Any], indent: int = 0) -> str:
         """Format hierarchy tree as indented text."""
-        if not node:
-            return ""
-        
+        # Iterative pre-order walk into one list, joined once at the end
         lines = []
-        prefix = "  " * indent + ("└─ " if indent > 0 else "")
-        lines.append(f"{prefix}{node['name']} ({node['type']})")
-        
-        for child in node.get('children', []):
-            lines.append(self._format_tree(child, indent + 1))
+        stack = [(node, indent)]
+        while stack:
+            current, depth = stack.pop()
+            if not current:
+                lines.append("")
+                continue
+            lines.append(f"{_tree_prefix(depth)}{current['name']} ({current['type']})")
+            stack.extend((child, depth + 1) for child in reversed(current.get('children', [])))
         
         return "\n".join(lines)
     
     def _extract_entities(self, query: str) -> List[str]:
         """Extract entity names from query."""
         # Simple implementation - could be enhanced
-        # Look for quoted strings or capitalized words
-        import re
-        
-        entities = []
-        
-        # Find quoted strings
-        quoted = re.findall(r'"([^"]+)"', query)
-        entities.extend(quoted)
-        
-        # Find capitalized phrases (simple heuristic)
-        words = query.split()
-        i = 0
-        while i < len(words):
-            if words[i][0].isupper():
-                phrase = [words[i]]
-                j = i + 1
-                while j < len(words) and words[j][0].isupper():
-                    phrase.append(words[j])
-                    j += 1
-                if len(phrase) > 0:
-                    entities.append(" ".join(phrase))
-                i = j
-            else:
-                i += 1
-        
+        # Quoted strings first, then runs of whitespace-separated words that
+        # start with an uppercase letter in any script (joined by single spaces)
+        entities = self._QUOTED_RE.findall(query)
+        entities.extend(
+            " ".join(run)
+            for is_upper, run in groupby(query.split(), key=lambda word: word[0].isupper())
+            if is_upper
+        )
         return entities
     
     def _get_team_entities(self, team: str, workstream: str) -> List[str]:
@@ -1,9 +1,13 @@
 """ONNX-based embedding generation with proper shape handling."""
 
+import asyncio
+import threading
 import numpy as np
 import onnxruntime as ort
 from transformers import AutoTokenizer
-from typing import List, Union
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 import os
 import logging
 from .config import settings
@@ -15,35 +19,142 @@ logger = logging.getLogger(__name__)
 class EmbeddingEngine:
     """Generate embeddings using ONNX model with consistent shape handling."""
 
-    def __init__(self):
-        """Initialize with ONNX model."""
+    _instance: Optional["EmbeddingEngine"] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "EmbeddingEngine":
+        """
+        Return the process-wide engine, loading it on first use.
+
+        The model and tokenizer take seconds and ~100 MB to load, so code
+        that just needs embeddings should share this instance rather than
+        constructing its own.
+        """
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = cls._instance = cls()
+        return instance
+
+    def __init__(self, intra_op_num_threads: Optional[int] = None):
+        """
+        Initialize with ONNX model.
+
+        Args:
+            intra_op_num_threads: Optional cap on ORT intra-op threads. Useful
+                when several engines share a host (one per worker process).
+        """
         model_path = settings.onnx_model_path
 
+        # Opt-in FP16 weights take precedence, then the opt-in INT8 copy. Both
+        # are built by scripts/download_model.py, never at startup, so server
+        # workers can't race each other writing (or reading half of) the file
+        if settings.onnx_fp16 and os.path.exists(settings.onnx_fp16_model_path):
+            model_path = settings.onnx_fp16_model_path
+        elif settings.onnx_quantize:
+            if os.path.exists(settings.onnx_quantized_model_path):
+                model_path = settings.onnx_quantized_model_path
+            else:
+                logger.warning(
+                    f"INT8 model not found at {settings.onnx_quantized_model_path}, "
+                    f"using FP32. Run 'python scripts/download_model.py' to build it."
+                )
+
+        # Fall back to the raw model if the optimized copy hasn't been built yet
+        if not os.path.exists(model_path) and os.path.exists(
+            settings.onnx_raw_model_path
+        ):
+            logger.warning(
+                f"Optimized ONNX model not found at {model_path}, using raw model. "
+                f"Run 'python scripts/download_model.py' to build it."
+            )
+            model_path = settings.onnx_raw_model_path
+
         if not os.path.exists(model_path):
             raise FileNotFoundError(
                 f"ONNX model not found at {model_path}. "
                 f"Please run 'python scripts/download_model.py' first."
             )
 
-        # Initialize ONNX session with optimization
+        # A pre-optimized graph is loaded as-is; otherwise optimize at load time
         sess_options = ort.SessionOptions()
-        sess_options.graph_optimization_level = (
-            ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if model_path.endswith(".opt.onnx"):
+            sess_options.graph_optimization_level = (
+                ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            )
+        else:
+            sess_options.graph_optimization_level = (
+                ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            )
+
+        # Pin threading rather than letting ORT claim every core it sees
+        # (wrong in containers, oversubscribed with concurrent encodes)
+        sess_options.intra_op_num_threads = (
+            intra_op_num_threads
+            or settings.onnx_intra_op_threads
+            or max(1, (os.cpu_count() or 2) // 2)
         )
+        sess_options.inter_op_num_threads = 1
+        sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        # Reuse activation buffers across runs
+        sess_options.enable_mem_pattern = True
+        sess_options.enable_cpu_mem_arena = True
+        # Finer-grained work splitting for the intra-op thread pool
+        sess_options.add_session_config_entry("session.dynamic_block_base", "4")
 
         self.session = ort.InferenceSession(
-            model_path, sess_options=sess_options, providers=["CPUExecutionProvider"]
+            model_path,
+            sess_options=sess_options,
+            # Grow the arena only by what a run asks for, not by doubling
+            providers=[
+                (
+                    "CPUExecutionProvider",
+                    {"arena_extend_strategy": "kSameAsRequested"},
+                )
+            ],
         )
+        self._output_name = self.session.get_outputs()[0].name
+        # IOBindings hold per-call state, so each encoding thread gets its own
+        self._io_local = threading.local()
 
-        # Initialize tokenizer
+        # Initialize tokenizer (Rust-backed fast tokenizer)
         self.tokenizer = AutoTokenizer.from_pretrained(
-            "sentence-transformers/all-MiniLM-L6-v2", clean_up_tokenization_spaces=True
+            "sentence-transformers/all-MiniLM-L6-v2",
+            clean_up_tokenization_spaces=True,
+            use_fast=True,
         )
+        if not self.tokenizer.is_fast:
+            logger.warning("Fast tokenizer unavailable; tokenization will be slow")
 
         # Model configuration
         self.max_length = 256
         self.embedding_dim = 384
 
+        # MiniLM takes single-segment input, so token_type_ids are always
+        # zero; slice them from one shared buffer instead of tokenizing them
+        self._zero_token_types = np.zeros(32 * self.max_length, dtype=np.int64)
+
+        # Recently embedded single texts (entity names recur across lookups),
+        # stored read-only so hits can be returned without a copy
+        self._single_cache: "OrderedDict[Tuple[str, bool], np.ndarray]" = OrderedDict()
+        self._single_cache_size = 4096
+        self._single_cache_lock = threading.Lock()
+
+        # Unpadded int64 token ids per text, so repeat texts skip the tokenizer
+        self._token_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._token_cache_size = 8192
+        self._token_cache_lock = threading.Lock()
+        self._pad_id = self.tokenizer.pad_token_id or 0
+
+        # Builds the next padded batch while ORT (which releases the GIL)
+        # runs the current one
+        self._batch_prep_pool = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="embed-prep"
+        )
+
         logger.info(f"Initialized embedding engine with model: {model_path}")
 
     def encode(
@@ -68,17 +179,17 @@ class EmbeddingEngine:
         if not texts:
             return np.array([])
 
+        if single_text:
+            key = (texts[0], normalize)
+            with self._single_cache_lock:
+                cached = self._single_cache.get(key)
+                if cached is not None:
+                    self._single_cache.move_to_end(key)
+                    return cached
+
         # Tokenize with proper error handling
         try:
-            encoded = self.tokenizer(
-                texts,
-                padding=True,
-                truncation=True,
-                max_length=self.max_length,
-                return_tensors="np",
-                return_attention_mask=True,
-                return_token_type_ids=True,
-            )
+            token_ids = self._tokenize(texts)
         except Exception as e:
             logger.error(f"Tokenization error: {e}")
             # Return zero embeddings on error
@@ -86,26 +197,15 @@ class EmbeddingEngine:
                 return np.zeros(self.embedding_dim, dtype=np.float32)
             return np.zeros((len(texts), self.embedding_dim), dtype=np.float32)
 
-        # Prepare inputs
-        input_ids = encoded["input_ids"].astype(np.int64)
-        attention_mask = encoded["attention_mask"].astype(np.int64)
-
-        # Handle token_type_ids (some models don't use them)
-        if "token_type_ids" in encoded:
-            token_type_ids = encoded["token_type_ids"].astype(np.int64)
-        else:
-            token_type_ids = np.zeros_like(input_ids, dtype=np.int64)
+        # Pad to the longest text as int64 model inputs
+        lengths = np.fromiter(map(len, token_ids), dtype=np.intp, count=len(texts))
+        input_ids, attention_mask = self._pad_batch(
+            token_ids, lengths, np.arange(len(texts)), self._pad_id
+        )
 
-        # Run inference
+        # Run inference and mean-pool over tokens
         try:
-            outputs = self.session.run(
-                None,
-                {
-                    "input_ids": input_ids,
-                    "attention_mask": attention_mask,
-                    "token_type_ids": token_type_ids,
-                },
-            )
+            embeddings = self._embed_tokens(input_ids, attention_mask)
         except Exception as e:
             logger.error(f"ONNX inference error: {e}")
             # Return zero embeddings on error
@@ -113,24 +213,44 @@ class EmbeddingEngine:
                 return np.zeros(self.embedding_dim, dtype=np.float32)
             return np.zeros((len(texts), self.embedding_dim), dtype=np.float32)
 
-        # Extract embeddings (last hidden state)
-        last_hidden_state = outputs[0]
-
-        # Mean pooling over tokens
-        embeddings = self._mean_pooling(last_hidden_state, attention_mask)
-
         # Normalize if requested
         if normalize:
-            embeddings = self._normalize_embeddings(embeddings)
+            self._normalize_rows_inplace(embeddings)
 
         # Return appropriate shape
         if single_text:
             # Return 1D array for single text
-            return embeddings[0]
+            embedding = embeddings[0]
+            embedding.setflags(write=False)
+            with self._single_cache_lock:
+                self._single_cache[key] = embedding
+                if len(self._single_cache) > self._single_cache_size:
+                    self._single_cache.popitem(last=False)
+            return embedding
         else:
             # Return 2D array for multiple texts
             return embeddings
 
+    def _token_type_ids(self, shape: Tuple[int, int]) -> np.ndarray:
+        """Contiguous all-zero token_type_ids of the given shape, without allocating."""
+        size = shape[0] * shape[1]
+        if size > self._zero_token_types.size:
+            self._zero_token_types = np.zeros(size, dtype=np.int64)
+        return self._zero_token_types[:size].reshape(shape)
+
+    def encode_one(self, text: str) -> np.ndarray:
+        """
+        Embed a single query text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Contiguous, L2-normalized float32 array of shape [embedding_dim],
+            ready to send to Qdrant or compare by dot product
+        """
+        return np.ascontiguousarray(self.encode(text), dtype=np.float32).reshape(-1)
+
     def encode_batch(
         self, texts: List[str], batch_size: int = 32, normalize: bool = True
     ) -> np.ndarray:
@@ -148,29 +268,145 @@ class EmbeddingEngine:
         if not texts:
             return np.zeros((0, self.embedding_dim), dtype=np.float32)
 
-        all_embeddings = []
+        # Embed each distinct text once (ingest batches repeat names a lot)
+        # and fan the rows back out to the caller's positions
+        positions: Dict[str, int] = {}
+        inverse = [positions.setdefault(text, len(positions)) for text in texts]
+        if len(positions) < len(texts):
+            unique = self._encode_unique(list(positions), batch_size, normalize)
+            return unique[inverse]
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
+        return self._encode_unique(texts, batch_size, normalize)
 
-            # Always process as list to get 2D output
-            embeddings = self.encode(batch, normalize=normalize)
+    def _encode_unique(
+        self, texts: List[str], batch_size: int, normalize: bool
+    ) -> np.ndarray:
+        """encode_batch() for a non-empty list of distinct texts."""
+        try:
+            token_ids = self._tokenize(texts)
+        except Exception as e:
+            logger.error(f"Tokenization error: {e}")
+            return np.zeros((len(texts), self.embedding_dim), dtype=np.float32)
 
-            # Ensure 2D shape
-            if embeddings.ndim == 1:
-                embeddings = embeddings.reshape(1, -1)
+        # Batch texts of similar length together so each batch pads only to
+        # its own longest text, not the longest in the whole input
+        lengths = np.fromiter(map(len, token_ids), dtype=np.intp, count=len(texts))
+        order = np.argsort(lengths, kind="stable")
+        pad_id = self._pad_id
+
+        result = np.zeros((len(texts), self.embedding_dim), dtype=np.float32)
+        batches = [order[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+        next_inputs = None
+        for k, rows in enumerate(batches):
+            if next_inputs is None:
+                input_ids, attention_mask = self._pad_batch(
+                    token_ids, lengths, rows, pad_id
+                )
+            else:
+                input_ids, attention_mask = next_inputs.result()
+            if k + 1 < len(batches):
+                next_inputs = self._batch_prep_pool.submit(
+                    self._pad_batch, token_ids, lengths, batches[k + 1], pad_id
+                )
+
+            try:
+                # Scatter back to the caller's order
+                result[rows] = self._embed_tokens(input_ids, attention_mask)
+            except Exception as e:
+                # Failed rows stay zero, as in encode()
+                logger.error(f"ONNX inference error: {e}")
 
-            all_embeddings.append(embeddings)
+        if normalize:
+            self._normalize_rows_inplace(result)
 
-        # Stack all batches
-        result = (
-            np.vstack(all_embeddings)
-            if all_embeddings
-            else np.zeros((0, self.embedding_dim), dtype=np.float32)
-        )
+        return result
+
+    def _tokenize(self, texts: List[str]) -> List[np.ndarray]:
+        """
+        Tokenize texts without padding, reusing cached token ids.
+
+        Cache misses go through the tokenizer together in one call.
+
+        Returns:
+            One int64 token-id array per text (shared with the cache; don't modify)
+        """
+        token_ids: List[Optional[np.ndarray]] = [None] * len(texts)
+        missing = []
+        with self._token_cache_lock:
+            for i, text in enumerate(texts):
+                ids = self._token_cache.get(text)
+                if ids is None:
+                    missing.append(i)
+                else:
+                    self._token_cache.move_to_end(text)
+                    token_ids[i] = ids
+
+        if missing:
+            encoded = self.tokenizer(
+                [texts[i] for i in missing],
+                padding=False,
+                truncation=True,
+                max_length=self.max_length,
+                return_attention_mask=False,
+                return_token_type_ids=False,
+            )["input_ids"]
+            with self._token_cache_lock:
+                for i, ids in zip(missing, encoded):
+                    ids = np.asarray(ids, dtype=np.int64)
+                    token_ids[i] = ids
+                    self._token_cache[texts[i]] = ids
+                while len(self._token_cache) > self._token_cache_size:
+                    self._token_cache.popitem(last=False)
+
+        return token_ids
+
+    @staticmethod
+    def _pad_batch(
+        token_ids: List[np.ndarray], lengths: np.ndarray, rows: np.ndarray, pad_id: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pad the given tokenized rows to their longest length as int64 model inputs."""
+        seq_len = int(lengths[rows].max())
+        input_ids = np.full((len(rows), seq_len), pad_id, dtype=np.int64)
+        attention_mask = np.zeros((len(rows), seq_len), dtype=np.int64)
+        for j, row in enumerate(rows):
+            length = lengths[row]
+            input_ids[j, :length] = token_ids[row]
+            attention_mask[j, :length] = 1
+        return input_ids, attention_mask
+
+    def _embed_tokens(
+        self, input_ids: np.ndarray, attention_mask: np.ndarray
+    ) -> np.ndarray:
+        """
+        Run the model on tokenized input and mean-pool the token embeddings.
 
-        # Ensure float32 dtype
-        return result.astype(np.float32)
+        Args:
+            input_ids: Token ids [batch_size, seq_len], int64
+            attention_mask: Attention mask [batch_size, seq_len], int64
+
+        Returns:
+            Unnormalized embeddings [batch_size, embedding_dim]
+        """
+        # Bind the NumPy inputs directly so ORT reads them without a copy
+        io_binding = self._io_binding()
+        io_binding.bind_cpu_input("input_ids", input_ids)
+        io_binding.bind_cpu_input("attention_mask", attention_mask)
+        io_binding.bind_cpu_input(
+            "token_type_ids", self._token_type_ids(input_ids.shape)
+        )
+        io_binding.bind_output(self._output_name, "cpu")
+        self.session.run_with_iobinding(io_binding)
+        last_hidden_state = io_binding.get_outputs()[0].numpy()
+        return self._mean_pooling(last_hidden_state, attention_mask)
+
+    def _io_binding(self) -> ort.IOBinding:
+        """This thread's reusable IOBinding for the session."""
+        io_binding = getattr(self._io_local, "binding", None)
+        if io_binding is None:
+            io_binding = self.session.io_binding()
+            self._io_local.binding = io_binding
+        return io_binding
 
     def _mean_pooling(
         self, last_hidden_state: np.ndarray, attention_mask: np.ndarray
@@ -185,17 +421,37 @@ class EmbeddingEngine:
         Returns:
             Pooled embeddings [batch_size, hidden_dim]
         """
-        # Expand attention mask to match embedding dimensions
-        input_mask_expanded = attention_mask[..., None].astype(np.float32)
-
-        # Sum embeddings for non-padding tokens
-        sum_embeddings = np.sum(last_hidden_state * input_mask_expanded, axis=1)
+        mask = attention_mask.astype(np.float32)
+        # An FP16 graph built without keep_io_types returns half-precision states
+        last_hidden_state = last_hidden_state.astype(np.float32, copy=False)
+
+        # Masked sum over tokens as one contraction, without materializing
+        # a masked copy of the hidden states
+        sum_embeddings = np.einsum(
+            "bld,bl->bd", last_hidden_state, mask, optimize=True
+        )
 
         # Count non-padding tokens
-        sum_mask = np.clip(input_mask_expanded.sum(axis=1), a_min=1e-9, a_max=None)
-
-        # Average
-        return sum_embeddings / sum_mask
+        sum_mask = mask.sum(axis=1, keepdims=True)
+        np.maximum(sum_mask, 1e-9, out=sum_mask)
+
+        # Average in place
+        sum_embeddings /= sum_mask
+        return sum_embeddings
+
+    @staticmethod
+    def _normalize_rows_inplace(embeddings: np.ndarray):
+        """L2-normalize the rows of a freshly computed 2D float array in place."""
+        embeddings *= EmbeddingEngine._inverse_row_norms(embeddings)[:, None]
+
+    @staticmethod
+    def _inverse_row_norms(embeddings: np.ndarray) -> np.ndarray:
+        """1 / L2 norm of each row (norms floored at 1e-9), in one pass over the rows."""
+        inverse = np.einsum("ij,ij->i", embeddings, embeddings)
+        np.maximum(inverse, 1e-18, out=inverse)
+        np.sqrt(inverse, out=inverse)
+        np.reciprocal(inverse, out=inverse)
+        return inverse
 
     def _normalize_embeddings(self, embeddings: np.ndarray) -> np.ndarray:
         """
@@ -209,24 +465,28 @@ class EmbeddingEngine:
         """
         if embeddings.ndim == 1:
             # Single embedding
-            norm = np.linalg.norm(embeddings)
+            norm = np.sqrt(np.dot(embeddings, embeddings))
             if norm > 0:
-                return embeddings / norm
+                return embeddings * (1.0 / norm)
             return embeddings
         else:
-            # Multiple embeddings
-            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-            # Avoid division by zero
-            norms = np.clip(norms, a_min=1e-9, a_max=None)
-            return embeddings / norms
-
-    def similarity(self, embedding1: np.ndarray, embedding2: np.ndarray) -> float:
+            # Multiple embeddings (the caller's array is left untouched)
+            return embeddings * self._inverse_row_norms(embeddings)[:, None]
+
+    def similarity(
+        self,
+        embedding1: np.ndarray,
+        embedding2: np.ndarray,
+        assume_normalized: bool = False,
+    ) -> float:
         """
         Calculate cosine similarity between two embeddings.
 
         Args:
             embedding1: First embedding
             embedding2: Second embedding
+            assume_normalized: Both inputs are already L2-normalized (as
+                encode() returns them by default), so skip normalizing
 
         Returns:
             Cosine similarity score between -1 and 1
@@ -238,14 +498,18 @@ class EmbeddingEngine:
             embedding2 = embedding2.squeeze()
 
         # Normalize
-        embedding1 = self._normalize_embeddings(embedding1)
-        embedding2 = self._normalize_embeddings(embedding2)
+        if not assume_normalized:
+            embedding1 = self._normalize_embeddings(embedding1)
+            embedding2 = self._normalize_embeddings(embedding2)
 
         # Dot product
         return float(np.dot(embedding1, embedding2))
 
     def batch_similarity(
-        self, query_embedding: np.ndarray, embeddings: np.ndarray
+        self,
+        query_embedding: np.ndarray,
+        embeddings: np.ndarray,
+        assume_normalized: bool = False,
     ) -> np.ndarray:
         """
         Calculate similarity between a query and multiple embeddings.
@@ -253,6 +517,8 @@ class EmbeddingEngine:
         Args:
             query_embedding: Query embedding (1D or 2D with shape [1, dim])
             embeddings: Multiple embeddings (2D array)
+            assume_normalized: Query and embeddings are already L2-normalized,
+                so the result is a single matrix-vector product
 
         Returns:
             Array of similarity scores
@@ -262,8 +528,157 @@ class EmbeddingEngine:
             query_embedding = query_embedding.squeeze()
 
         # Normalize all
-        query_embedding = self._normalize_embeddings(query_embedding)
-        embeddings = self._normalize_embeddings(embeddings)
+        if not assume_normalized:
+            query_embedding = self._normalize_embeddings(query_embedding)
+            embeddings = self._normalize_embeddings(embeddings)
 
         # Calculate similarities
         return np.dot(embeddings, query_embedding)
+
+    def similarity_matrix(
+        self,
+        query_embeddings: np.ndarray,
+        embeddings: np.ndarray,
+        assume_normalized: bool = False,
+    ) -> np.ndarray:
+        """
+        Calculate similarity between several queries and multiple embeddings.
+
+        One matrix product instead of a batch_similarity() call per query.
+
+        Args:
+            query_embeddings: Query embeddings (2D array, shape [n_queries, dim])
+            embeddings: Multiple embeddings (2D array, shape [n, dim])
+            assume_normalized: Queries and embeddings are already L2-normalized
+
+        Returns:
+            Array of similarity scores with shape [n_queries, n]
+        """
+        query_embeddings = np.atleast_2d(query_embeddings)
+
+        # Normalize all
+        if not assume_normalized:
+            query_embeddings = self._normalize_embeddings(query_embeddings)
+            embeddings = self._normalize_embeddings(embeddings)
+
+        # C-contiguous operands let BLAS use its fastest GEMM kernel
+        return np.dot(
+            np.ascontiguousarray(query_embeddings), np.ascontiguousarray(embeddings).T
+        )
+
+
+class AsyncEmbeddingBatcher:
+    """
+    Coalesce concurrent single-text encodes into one ONNX call.
+
+    Requests queue up; a background task takes up to max_batch texts, waiting
+    at most max_wait seconds for more to arrive, encodes them together and
+    resolves each caller's future with its row.
+    """
+
+    def __init__(
+        self,
+        engine: EmbeddingEngine,
+        executor: Optional[Executor] = None,
+        max_batch: int = 32,
+        max_wait: float = 0.005,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            engine: EmbeddingEngine doing the encoding
+            executor: Executor for encode_batch (default: the loop's default executor)
+            max_batch: Most texts encoded in one call
+            max_wait: Seconds to wait for more texts after the first arrives
+        """
+        self.engine = engine
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def encode(self, text: str) -> np.ndarray:
+        """Embed one text as a normalized 1D float32 vector."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._loop is not loop:
+            # Started lazily so it binds to the running loop; restarted when
+            # called from a new loop (each in-process client runs its own) or
+            # after the previous task stopped
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = loop.create_task(self._run())
+
+        future = loop.create_future()
+        self._queue.put_nowait((text, future))
+        return await future
+
+    async def aclose(self):
+        """Stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._queue is not None:
+            # A task cancelled before its first step never drained the queue
+            self._fail_pending(self._queue, [], RuntimeError("Embedding batcher was closed"))
+
+    @staticmethod
+    def _fail_pending(
+        queue: asyncio.Queue, batch: List[Tuple[str, asyncio.Future]], error: BaseException
+    ):
+        """Set error on the batch and every queued request still pending."""
+        while not queue.empty():
+            batch.append(queue.get_nowait())
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        batch: List[Tuple[str, asyncio.Future]] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                texts = [text for text, _ in batch]
+                try:
+                    vectors = await loop.run_in_executor(
+                        self.executor, self.engine.encode_batch, texts, self.max_batch
+                    )
+                except Exception as e:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(e)
+                    batch = []
+                    continue
+
+                for (_, future), vector in zip(batch, vectors):
+                    if not future.done():
+                        future.set_result(vector)
+                batch = []
+        except asyncio.CancelledError:
+            # Closed: fail everyone still waiting instead of leaving their
+            # futures unresolved
+            self._fail_pending(queue, batch, RuntimeError("Embedding batcher was closed"))
+            raise
+        except Exception as e:
+            # Crashed: the next encode() starts a fresh task
+            logger.error(f"Embedding batcher stopped: {e}")
+            self._fail_pending(queue, batch, e)
+
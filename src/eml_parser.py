@@ -1,5 +1,6 @@
-import email
 from email.header import decode_header
+from email.parser import BytesParser
+from email.policy import default as default_policy
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,9 +10,13 @@ class EMLParser:
 
     def __init__(self, file_path: str):
         self.file_path = file_path
+        self._body = None
+        self._header_cache = {}
         try:
+            # Modern policy: headers arrive decoded and get_content() handles
+            # transfer encoding and charset
             with open(self.file_path, 'rb') as f:
-                self.msg = email.message_from_bytes(f.read())
+                self.msg = BytesParser(policy=default_policy).parse(f)
         except FileNotFoundError:
             logger.error(f"EML file not found at: {self.file_path}")
             self.msg = None
@@ -24,46 +29,57 @@ class EMLParser:
         if not self.msg:
             return ""
         
+        # Header names are case-insensitive
+        key = header_name.lower()
+        cached = self._header_cache.get(key)
+        if cached is not None:
+            return cached
+        
         header_value = self.msg.get(header_name)
         if not header_value:
-            return ""
+            result = ""
+        else:
+            try:
+                decoded_parts = decode_header(header_value)
+                header_parts = []
+                for part, charset in decoded_parts:
+                    if isinstance(part, bytes):
+                        header_parts.append(part.decode(charset or 'utf-8'))
+                    else:
+                        header_parts.append(part)
+                result = "".join(header_parts)
+            except Exception as e:
+                logger.warning(f"Could not decode header '{header_name}': {e}")
+                result = str(header_value)
         
-        try:
-            decoded_parts = decode_header(header_value)
-            header_parts = []
-            for part, charset in decoded_parts:
-                if isinstance(part, bytes):
-                    header_parts.append(part.decode(charset or 'utf-8'))
-                else:
-                    header_parts.append(part)
-            return "".join(header_parts)
-        except Exception as e:
-            logger.warning(f"Could not decode header '{header_name}': {e}")
-            return header_value
+        self._header_cache[key] = result
+        return result
 
     def get_body(self) -> str:
         """Get the text body of the email."""
         if not self.msg:
             return ""
+        if self._body is not None:
+            return self._body
 
         if self.msg.is_multipart():
-            for part in self.msg.walk():
-                content_type = part.get_content_type()
-                content_disposition = str(part.get('Content-Disposition'))
-
-                if content_type == 'text/plain' and 'attachment' not in content_disposition:
-                    try:
-                        return part.get_payload(decode=True).decode(part.get_content_charset() or 'utf-8')
-                    except Exception as e:
-                        logger.warning(f"Could not decode email body part: {e}")
-                        return ""
+            # First non-attachment text/plain part
+            part = self.msg.get_body(preferencelist=('plain',))
         else:
+            part = self.msg
+
+        body = ""
+        if part is not None:
             try:
-                return self.msg.get_payload(decode=True).decode(self.msg.get_content_charset() or 'utf-8')
+                body = part.get_content()
+                if isinstance(body, bytes):
+                    body = body.decode(part.get_content_charset() or 'utf-8')
             except Exception as e:
                 logger.warning(f"Could not decode email body: {e}")
-                return ""
-        return ""
+                body = ""
+
+        self._body = body
+        return body
 
     def get_message_id(self) -> str:
         """Get the Message-ID header."""
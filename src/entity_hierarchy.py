@@ -3,8 +3,10 @@ Hierarchical entity management for complex project structures.
 Handles parent-child relationships and context propagation.
 """
 
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
+import re
+import sys
 import uuid
 from datetime import datetime
 import logging
@@ -15,7 +17,7 @@ from src.storage import MemoryStorage
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class HierarchicalEntity:
     """Entity with hierarchical relationships."""
     entity: Entity
@@ -48,9 +50,44 @@ class EntityHierarchyManager:
         }
     }
     
+    # Case-insensitive scan of the state, so no lowercased copy is built
+    _RISK_RE = re.compile('risk', re.IGNORECASE)
+    
     def __init__(self, storage: MemoryStorage):
         self.storage = storage
-        self._hierarchy_cache = {}  # entity_id -> HierarchicalEntity
+        # Hierarchy as parallel arrays indexed by each entity's interned
+        # position, so hops are list indexing rather than object lookups
+        self._id_to_idx: Dict[str, int] = {}
+        self._entities: List[Entity] = []
+        self._parent: List[int] = []  # -1 for roots
+        self._level: List[int] = []  # 0=root, 1=project, 2=workstream, 3=task
+        self._children: List[List[int]] = []
+        self._tags: List[Set[str]] = []
+        
+    def _intern(self, entity: Entity) -> int:
+        """Return the entity's index, adding an empty row on first sight."""
+        idx = self._id_to_idx.get(entity.id)
+        if idx is None:
+            idx = len(self._entities)
+            self._id_to_idx[entity.id] = idx
+            self._entities.append(entity)
+            self._parent.append(-1)
+            self._level.append(0)
+            self._children.append([])
+            self._tags.append(set())
+        return idx
+    
+    def _view(self, idx: int) -> HierarchicalEntity:
+        """Materialize one row as a HierarchicalEntity (tags are shared, not copied)."""
+        entities = self._entities
+        parent = self._parent[idx]
+        return HierarchicalEntity(
+            entity=entities[idx],
+            parent_id=entities[parent].id if parent >= 0 else None,
+            children_ids=[entities[child].id for child in self._children[idx]],
+            hierarchy_level=self._level[idx],
+            context_tags=self._tags[idx]
+        )
         
     def create_or_update_hierarchy(
         self,
@@ -60,64 +97,50 @@ class EntityHierarchyManager:
     ) -> HierarchicalEntity:
         """Create or update entity with hierarchical context."""
         
-        # Get or create hierarchical wrapper
-        if entity.id in self._hierarchy_cache:
-            h_entity = self._hierarchy_cache[entity.id]
-        else:
-            h_entity = HierarchicalEntity(entity=entity)
-            self._hierarchy_cache[entity.id] = h_entity
+        idx = self._intern(entity)
         
         # Try to find parent from potential names
-        if not h_entity.parent_id and potential_parent_names:
+        if self._parent[idx] < 0 and potential_parent_names:
             parent = self._find_best_parent(entity, potential_parent_names)
             if parent:
-                self._set_parent(h_entity, parent)
+                self._set_parent(idx, parent)
         
-        # Add context tags from meeting
+        # Add context tags from meeting; interned, since the same few tags
+        # repeat across every entity (and _set_parent copies them down)
+        tags = self._tags[idx]
         if meeting_context.get('workstream'):
-            h_entity.context_tags.add(f"workstream:{meeting_context['workstream']}")
+            tags.add(sys.intern(f"workstream:{meeting_context['workstream']}"))
         if meeting_context.get('team'):
-            h_entity.context_tags.add(f"team:{meeting_context['team']}")
+            tags.add(sys.intern(f"team:{meeting_context['team']}"))
             
-        return h_entity
+        return self._view(idx)
     
     def _find_best_parent(self, entity: Entity, potential_names: List[str]) -> Optional[Entity]:
         """Find the most likely parent entity from potential names."""
         rules = self.HIERARCHY_RULES.get(entity.type, {})
         typical_parents = rules.get('typical_parents', [])
         
-        for name in potential_names:
-            # Search for entities with matching names
-            candidates = self.storage.search_entities(name)
-            
-            for candidate in candidates:
-                # Check if this entity type can be a parent
-                if candidate.type in typical_parents:
-                    return candidate
-                    
-        return None
+        # One query matches every name and filters to parent-capable types,
+        # earliest name first
+        return self.storage.find_first_entity_matching(potential_names, typical_parents)
     
-    def _set_parent(self, child: HierarchicalEntity, parent: Entity):
+    def _set_parent(self, child_idx: int, parent: Entity):
         """Set parent-child relationship."""
-        child.parent_id = parent.id
+        parent_idx = self._intern(parent)
+        self._parent[child_idx] = parent_idx
         
         # Update parent's children
-        if parent.id in self._hierarchy_cache:
-            parent_h = self._hierarchy_cache[parent.id]
-        else:
-            parent_h = HierarchicalEntity(entity=parent)
-            self._hierarchy_cache[parent.id] = parent_h
-            
-        if child.entity.id not in parent_h.children_ids:
-            parent_h.children_ids.append(child.entity.id)
+        siblings = self._children[parent_idx]
+        if child_idx not in siblings:
+            siblings.append(child_idx)
             
         # Update hierarchy levels
-        child.hierarchy_level = parent_h.hierarchy_level + 1
+        self._level[child_idx] = self._level[parent_idx] + 1
         
         # Propagate context tags from parent
-        child.context_tags.update(parent_h.context_tags)
+        self._tags[child_idx].update(self._tags[parent_idx])
         
-        logger.info(f"Set hierarchy: {parent.name} -> {child.entity.name}")
+        logger.info(f"Set hierarchy: {parent.name} -> {self._entities[child_idx].name}")
     
     def propagate_state_change(
         self,
@@ -131,27 +154,24 @@ class EntityHierarchyManager:
         """
         affected = []
         
-        if entity_id not in self._hierarchy_cache:
+        idx = self._id_to_idx.get(entity_id)
+        if idx is None:
             return affected
-            
-        h_entity = self._hierarchy_cache[entity_id]
         
         # Propagate up to parent
-        if direction in ['up', 'both'] and h_entity.parent_id:
-            parent = self._hierarchy_cache.get(h_entity.parent_id)
-            if parent:
-                reason = self._get_propagation_reason(state_change, 'up')
-                if reason:
-                    affected.append((h_entity.parent_id, reason))
-        
-        # Propagate down to children
-        if direction in ['down', 'both']:
-            for child_id in h_entity.children_ids:
-                child = self._hierarchy_cache.get(child_id)
-                if child:
-                    reason = self._get_propagation_reason(state_change, 'down')
-                    if reason:
-                        affected.append((child_id, reason))
+        parent = self._parent[idx]
+        if direction in ['up', 'both'] and parent >= 0:
+            reason = self._get_propagation_reason(state_change, 'up')
+            if reason:
+                affected.append((self._entities[parent].id, reason))
+        
+        # Propagate down to children (one reason applies to all of them)
+        children = self._children[idx]
+        if direction in ['down', 'both'] and children:
+            reason = self._get_propagation_reason(state_change, 'down')
+            if reason:
+                entities = self._entities
+                affected.extend((entities[child].id, reason) for child in children)
                         
         return affected
     
@@ -159,51 +179,59 @@ class EntityHierarchyManager:
         """Determine if and why a state change should propagate."""
         
         # Extract the actual state change
-        if state_change.to_state.get('status') == 'blocked':
+        to_state = state_change.to_state
+        status = to_state.get('status')
+        if status == 'blocked':
             if direction == 'up':
                 return "Child entity is blocked"
             else:
                 return "Parent entity is blocked - may affect this task"
                 
-        elif state_change.to_state.get('status') == 'completed':
+        elif status == 'completed':
             if direction == 'up':
                 return "Child task completed - check if parent can progress"
                 
-        elif 'risk' in str(state_change.to_state).lower():
+        elif self._RISK_RE.search(str(to_state)):
             return "Risk identified in related entity"
             
         return None
     
     def get_entity_tree(self, root_id: str, max_depth: int = 3) -> Dict[str, Any]:
         """Get full hierarchy tree for an entity."""
-        if root_id not in self._hierarchy_cache:
+        root = self._id_to_idx.get(root_id)
+        if root is None:
             return {}
-            
-        def build_tree(entity_id: str, depth: int) -> Dict[str, Any]:
-            if depth > max_depth:
-                return None
-                
-            h_entity = self._hierarchy_cache.get(entity_id)
-            if not h_entity:
-                return None
-                
-            node = {
-                'id': entity_id,
-                'name': h_entity.entity.name,
-                'type': h_entity.entity.type,
-                'level': h_entity.hierarchy_level,
-                'tags': list(h_entity.context_tags),
+        
+        entities, levels, tags, children = (
+            self._entities, self._level, self._tags, self._children
+        )
+        
+        def make_node(idx: int) -> Dict[str, Any]:
+            entity = entities[idx]
+            return {
+                'id': entity.id,
+                'name': entity.name,
+                'type': entity.type,
+                'level': levels[idx],
+                'tags': list(tags[idx]),
                 'children': []
             }
+        
+        # Explicit stack instead of recursion; each node's children are
+        # appended in order when the node is expanded
+        root_node = make_node(root)
+        stack = [(root, 0, root_node)]
+        while stack:
+            idx, depth, node = stack.pop()
+            if depth >= max_depth:
+                continue
+            child_nodes = node['children']
+            for child in children[idx]:
+                child_node = make_node(child)
+                child_nodes.append(child_node)
+                stack.append((child, depth + 1, child_node))
             
-            for child_id in h_entity.children_ids:
-                child_node = build_tree(child_id, depth + 1)
-                if child_node:
-                    node['children'].append(child_node)
-                    
-            return node
-            
-        return build_tree(root_id, 0)
+        return root_node
     
     def find_related_entities(
         self,
@@ -213,32 +241,25 @@ class EntityHierarchyManager:
         """Find all related entities in the hierarchy."""
         related = {'parent': [], 'child': [], 'sibling': []}
         
-        if entity_id not in self._hierarchy_cache:
+        idx = self._id_to_idx.get(entity_id)
+        if idx is None:
             return related
             
-        h_entity = self._hierarchy_cache[entity_id]
+        entities = self._entities
+        parent = self._parent[idx]
         
         # Parent
-        if 'parent' in relationship_types and h_entity.parent_id:
-            parent = self._hierarchy_cache.get(h_entity.parent_id)
-            if parent:
-                related['parent'].append(parent.entity)
+        if 'parent' in relationship_types and parent >= 0:
+            related['parent'].append(entities[parent])
         
         # Children
         if 'child' in relationship_types:
-            for child_id in h_entity.children_ids:
-                child = self._hierarchy_cache.get(child_id)
-                if child:
-                    related['child'].append(child.entity)
+            related['child'] = [entities[child] for child in self._children[idx]]
         
         # Siblings (same parent)
-        if 'sibling' in relationship_types and h_entity.parent_id:
-            parent = self._hierarchy_cache.get(h_entity.parent_id)
-            if parent:
-                for sibling_id in parent.children_ids:
-                    if sibling_id != entity_id:
-                        sibling = self._hierarchy_cache.get(sibling_id)
-                        if sibling:
-                            related['sibling'].append(sibling.entity)
+        if 'sibling' in relationship_types and parent >= 0:
+            related['sibling'] = [
+                entities[sibling] for sibling in self._children[parent] if sibling != idx
+            ]
                             
-        return related
\ No newline at end of file
+        return related
@@ -43,6 +43,9 @@ class EntityResolver:
         # Thread-safe caching
         self._cache_lock = threading.RLock()
         self._entity_cache: Optional[List[Entity]] = None
+        self._entity_names_lower: List[str] = []  # Parallel to _entity_cache
+        self._normalized_index: Dict[str, Entity] = {}
+        self._id_index: Dict[str, Entity] = {}
         self._cache_time: Optional[datetime] = None
         
         # Performance metrics
@@ -67,6 +70,13 @@ class EntityResolver:
                 
                 logger.info("Refreshing entity cache...")
                 self._entity_cache = self.storage.get_all_entities()
+                self._entity_names_lower = [e.name.lower() for e in self._entity_cache]
+                # First entity wins on duplicate names, as the linear scan did
+                normalized_index = {}
+                for entity in self._entity_cache:
+                    normalized_index.setdefault(entity.normalized_name, entity)
+                self._normalized_index = normalized_index
+                self._id_index = {e.id: e for e in self._entity_cache}
                 self._cache_time = now
                 
                 self._resolution_stats['cache_misses'] += 1
@@ -106,23 +116,31 @@ class EntityResolver:
         fuzzy_candidates = {}
         llm_candidates = []
         
+        remaining = []
         for term in query_terms:
             # Try exact match first (fastest)
             match = self._try_exact_match(term, entities)
             if match:
                 exact_matches[term] = match
                 self._resolution_stats['exact_matches'] += 1
-                continue
-            
-            # Try vector similarity
-            vector_match = self._try_vector_match(term, entities)
+            else:
+                remaining.append(term)
+        
+        # Try vector similarity: one encode and one Qdrant request for all terms
+        vector_matches = self._vector_match_batch(remaining)
+        unresolved = []
+        for term in remaining:
+            vector_match = vector_matches.get(term)
             if vector_match and vector_match.confidence >= self.vector_threshold:
                 vector_candidates[term] = vector_match
                 self._resolution_stats['vector_matches'] += 1
-                continue
-            
-            # Try fuzzy matching
-            fuzzy_match = self._try_fuzzy_match(term, entities)
+            else:
+                unresolved.append(term)
+        
+        # Fuzzy-match every remaining term in one scoring pass
+        fuzzy_matches = self._fuzzy_match_batch(unresolved, entities)
+        for term in unresolved:
+            fuzzy_match = fuzzy_matches.get(term)
             if fuzzy_match and fuzzy_match.confidence >= self.fuzzy_threshold:
                 fuzzy_candidates[term] = fuzzy_match
                 self._resolution_stats['fuzzy_matches'] += 1
@@ -157,89 +175,128 @@ class EntityResolver:
         """Try exact name matching."""
         normalized_term = term.lower().strip()
         
-        for entity in entities:
-            if entity.normalized_name == normalized_term:
-                return EntityMatch(
-                    query_term=term,
-                    entity=entity,
-                    confidence=1.0,
-                    match_type='exact'
-                )
+        with self._cache_lock:
+            index = self._normalized_index if entities is self._entity_cache else None
+        if index is not None:
+            entity = index.get(normalized_term)
+        else:
+            entity = next(
+                (e for e in entities if e.normalized_name == normalized_term), None
+            )
+        
+        if entity:
+            return EntityMatch(
+                query_term=term,
+                entity=entity,
+                confidence=1.0,
+                match_type='exact'
+            )
         
         return None
     
     def _try_vector_match(self, term: str, entities: List[Entity]) -> Optional[EntityMatch]:
         """Try vector similarity matching using Qdrant."""
+        return self._vector_match_batch([term]).get(term)
+    
+    def _vector_match_batch(self, terms: List[str]) -> Dict[str, EntityMatch]:
+        """Vector-match several terms with one batched encode and one Qdrant batch search."""
+        if not terms:
+            return {}
+        
         try:
-            query_embedding = self.embeddings.encode(term)
-            if query_embedding.ndim > 1:
-                query_embedding = query_embedding[0]
+            query_embeddings = self.embeddings.encode_batch(terms)
             
-            # Search Qdrant for similar entity embeddings
-            qdrant_results = self.storage.search_entity_embeddings(query_embedding, limit=1)
+            # Top hit per term from Qdrant
+            batch_results = self.storage.search_entity_embeddings_batch(query_embeddings, limit=1)
+            best_hits = {}
+            for term, qdrant_results in zip(terms, batch_results):
+                if qdrant_results:
+                    entity_id, score = qdrant_results[0]
+                    if score > 0.5:  # Minimum threshold for Qdrant match
+                        best_hits[term] = (entity_id, score)
             
-            if qdrant_results:
-                entity_id, score = qdrant_results[0]
-                if score > 0.5:  # Minimum threshold for Qdrant match
-                    # Retrieve the full entity object from SQLite
-                    entity = self.storage.get_entity(entity_id)
-                    if entity:
-                        return EntityMatch(
-                            query_term=term,
-                            entity=entity,
-                            confidence=score,
-                            match_type='vector',
-                            metadata={'similarity_score': score}
-                        )
+            # Retrieve the full entity objects from SQLite in one query
+            found = self.storage.get_entities_batch(
+                list({entity_id for entity_id, _ in best_hits.values()})
+            )
+            
+            matches = {}
+            for term, (entity_id, score) in best_hits.items():
+                entity = found.get(entity_id)
+                if entity:
+                    matches[term] = EntityMatch(
+                        query_term=term,
+                        entity=entity,
+                        confidence=score,
+                        match_type='vector',
+                        metadata={'similarity_score': score}
+                    )
+            return matches
         except Exception as e:
-            logger.warning(f"Vector matching failed for '{term}': {e}")
+            logger.warning(f"Vector matching failed for {terms}: {e}")
         
-        return None
+        return {}
+    
+    def _entity_names(self, entities: List[Entity]) -> List[str]:
+        """Lowercased names parallel to entities, reusing the cached list when possible."""
+        with self._cache_lock:
+            if entities is self._entity_cache:
+                return self._entity_names_lower
+        return [e.name.lower() for e in entities]
     
     def _try_fuzzy_match(self, term: str, entities: List[Entity]) -> Optional[EntityMatch]:
         """Try fuzzy string matching."""
+        return self._fuzzy_match_batch([term], entities).get(term)
+    
+    def _fuzzy_match_batch(self, terms: List[str], entities: List[Entity]) -> Dict[str, EntityMatch]:
+        """Fuzzy-match several terms against all entities in one similarity-matrix call."""
+        if not terms:
+            return {}
+        
         try:
-            from fuzzywuzzy import fuzz
+            from rapidfuzz import fuzz, process
         except ImportError:
-            logger.warning("fuzzywuzzy not installed, skipping fuzzy matching")
-            return None
+            logger.warning("rapidfuzz not installed, skipping fuzzy matching")
+            return {}
         
-        term_lower = term.lower()
-        best_match = None
-        best_score = 0.0
+        terms_lower = [term.lower() for term in terms]
+        names = self._entity_names(entities)
+        if not names:
+            return {}
         
-        for entity in entities:
-            entity_lower = entity.name.lower()
-            
-            # Multiple fuzzy strategies
-            scores = [
-                fuzz.ratio(term_lower, entity_lower) / 100.0,
-                fuzz.partial_ratio(term_lower, entity_lower) / 100.0,
-                fuzz.token_sort_ratio(term_lower, entity_lower) / 100.0,
-                fuzz.token_set_ratio(term_lower, entity_lower) / 100.0
-            ]
-            
-            # Use the best score
-            max_score = max(scores)
-            
-            # Boost score if one contains the other
-            if term_lower in entity_lower or entity_lower in term_lower:
-                max_score = min(max_score * 1.2, 1.0)
-            
-            if max_score > best_score:
-                best_score = max_score
-                best_match = entity
+        # WRatio blends ratio, partial and token-based scores; the whole
+        # terms x entities matrix is scored in C across all cores
+        scores = process.cdist(
+            terms_lower, names, scorer=fuzz.WRatio, processor=None, workers=-1
+        ) / 100.0
         
-        if best_match and best_score > 0.5:
-            return EntityMatch(
-                query_term=term,
-                entity=best_match,
-                confidence=best_score,
-                match_type='fuzzy',
-                metadata={'fuzzy_score': best_score}
-            )
+        # Boost pairs where one contains the other before picking the best
+        # entity, so a boosted substring match can win and clear the threshold.
+        # partial_ratio is 100 exactly when the shorter string is a substring
+        # of the longer, so the containment mask is computed in C as well
+        contained = process.cdist(
+            terms_lower, names, scorer=fuzz.partial_ratio, processor=None,
+            score_cutoff=100, workers=-1
+        ) == 100
+        scores[contained] = np.minimum(scores[contained] * 1.2, 1.0)
         
-        return None
+        best_indices = np.argmax(scores, axis=1)
+        best_scores = scores[np.arange(len(terms)), best_indices]
+        
+        matches = {}
+        for term, index, best_score in zip(
+            terms, best_indices.tolist(), best_scores.tolist()
+        ):
+            if best_score > 0.5:
+                matches[term] = EntityMatch(
+                    query_term=term,
+                    entity=entities[index],
+                    confidence=best_score,
+                    match_type='fuzzy',
+                    metadata={'fuzzy_score': best_score}
+                )
+        
+        return matches
     
     def _resolve_with_llm(self, 
                          terms: List[str], 
@@ -329,7 +386,9 @@ Instructions:
                 resolutions = arguments.get("resolutions", [])
                 
                 matches = {}
-                entity_lookup = {e.id: e for e in entities}
+                with self._cache_lock:
+                    cached = entities is self._entity_cache
+                    entity_lookup = self._id_index if cached else {e.id: e for e in entities}
                 
                 for res in resolutions:
                     term = res.get("query_term")
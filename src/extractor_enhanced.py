@@ -4,7 +4,7 @@ import json
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from openai import OpenAI, AuthenticationError, BadRequestError
+from openai import OpenAI, AsyncOpenAI, AuthenticationError, BadRequestError
 import httpx
 from .models import (
     Memory,
@@ -20,9 +20,10 @@ logger = logging.getLogger(__name__)
 class EnhancedMeetingExtractor:
     """Extract comprehensive business intelligence from meeting transcripts."""
 
-    def __init__(self, llm_client: OpenAI):
-        """Initialize with shared LLM client."""
+    def __init__(self, llm_client: OpenAI, async_llm_client: Optional[AsyncOpenAI] = None):
+        """Initialize with shared LLM clients (async one is used by aextract)."""
         self.client = llm_client
+        self.async_client = async_llm_client
         
         self.system_prompt = """You are a world-class management consultant and an expert notetaker. Your task is to analyze the provided meeting transcript and produce a highly detailed, structured set of internal notes.
 
@@ -354,88 +355,120 @@ IMPORTANT: You must respond ONLY with valid JSON that matches the provided schem
             }
         }
 
+        self.prebuild_prompts()
+
+    def prebuild_prompts(self):
+        """
+        Build the fixed parts of the extraction request once: the system
+        message and the serialized schema instructions. Call again after
+        changing system_prompt or json_schema.
+        """
+        self._system_message = {"role": "system", "content": self.system_prompt}
+        schema_str = json.dumps(self.json_schema["schema"], indent=2)
+        self._schema_instructions = f"\n\nRESPOND ONLY WITH VALID JSON. No other text. The JSON must match this exact schema:\n\n{schema_str}\n\nRemember: Start with {{ and end with }}. No explanations."
+
     def extract(self, transcript: str, meeting_id: str, email_metadata: Optional[Dict[str, Any]] = None) -> ExtractionResult:
         """Extract comprehensive meeting intelligence."""
         try:
-            # Add email metadata to prompt if available
-            context = f"Extract business intelligence from this transcript:\n\n{transcript}"
-            
-            if email_metadata:
-                context += f"\n\nEmail Context:\n"
-                if email_metadata.get("from"):
-                    context += f"From: {email_metadata['from']}\n"
-                if email_metadata.get("to"):
-                    context += f"To: {', '.join(email_metadata['to'])}\n"
-                if email_metadata.get("date"):
-                    context += f"Date: {email_metadata['date']}\n"
-                if email_metadata.get("subject"):
-                    context += f"Subject: {email_metadata['subject']}\n"
-
-            # Call LLM with enhanced schema
-            # Add schema to the user message for Claude
-            schema_str = json.dumps(self.json_schema["schema"], indent=2)
-            context_with_schema = f"{context}\n\nRESPOND ONLY WITH VALID JSON. No other text. The JSON must match this exact schema:\n\n{schema_str}\n\nRemember: Start with {{ and end with }}. No explanations."
-            
             response = self.client.chat.completions.create(
-                model=settings.clean_openrouter_model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": context_with_schema}
-                ],
-                temperature=0.3,
-                max_tokens=20000
+                **self._completion_kwargs(transcript, email_metadata)
             )
+            return self._parse_response(response, meeting_id, transcript)
+        except Exception as e:
+            return self._fallback_extraction(e, transcript, meeting_id)
 
-            # Parse response
-            content = response.choices[0].message.content
-            logger.info(f"LLM response content: {repr(content)[:200]}")
-            logger.info(f"LLM response type: {type(content)}")
-            logger.info(f"Full response: {response}")
-            
-            if not content:
-                logger.error("Empty response from LLM")
-                raise ValueError("Empty response from LLM")
-            data = json.loads(content)
-            
-            # Convert to our format while preserving all the rich data
-            return self._convert_to_extraction_result(data, meeting_id, transcript)
-            
-        except AuthenticationError as e:
-            logger.error(f"OpenAI Authentication failed: {e}")
+    async def aextract(self, transcript: str, meeting_id: str, email_metadata: Optional[Dict[str, Any]] = None) -> ExtractionResult:
+        """Async variant of extract; awaits the LLM call instead of blocking the event loop."""
+        if self.async_client is None:
+            raise RuntimeError("EnhancedMeetingExtractor was created without an async LLM client")
+        try:
+            response = await self.async_client.chat.completions.create(
+                **self._completion_kwargs(transcript, email_metadata)
+            )
+            return self._parse_response(response, meeting_id, transcript)
+        except Exception as e:
+            return self._fallback_extraction(e, transcript, meeting_id)
+
+    def _completion_kwargs(self, transcript: str, email_metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the chat completion request for a transcript."""
+        # Add email metadata to prompt if available
+        context = f"Extract business intelligence from this transcript:\n\n{transcript}"
+        
+        if email_metadata:
+            context += f"\n\nEmail Context:\n"
+            if email_metadata.get("from"):
+                context += f"From: {email_metadata['from']}\n"
+            if email_metadata.get("to"):
+                context += f"To: {', '.join(email_metadata['to'])}\n"
+            if email_metadata.get("date"):
+                context += f"Date: {email_metadata['date']}\n"
+            if email_metadata.get("subject"):
+                context += f"Subject: {email_metadata['subject']}\n"
+
+        # Call LLM with enhanced schema
+        # Add schema to the user message for Claude (prebuilt in prebuild_prompts)
+        return {
+            "model": settings.clean_openrouter_model,
+            "messages": [
+                self._system_message,
+                {"role": "user", "content": context + self._schema_instructions}
+            ],
+            "temperature": 0.3,
+            "max_tokens": 20000,
+        }
+
+    def _parse_response(self, response, meeting_id: str, transcript: str) -> ExtractionResult:
+        """Parse the LLM response into an ExtractionResult."""
+        content = response.choices[0].message.content
+        logger.info(f"LLM response content: {repr(content)[:200]}")
+        logger.info(f"LLM response type: {type(content)}")
+        logger.info(f"Full response: {response}")
+        
+        if not content:
+            logger.error("Empty response from LLM")
+            raise ValueError("Empty response from LLM")
+        data = json.loads(content)
+        
+        # Convert to our format while preserving all the rich data
+        return self._convert_to_extraction_result(data, meeting_id, transcript)
+
+    def _fallback_extraction(self, error: Exception, transcript: str, meeting_id: str) -> ExtractionResult:
+        """Log an extraction failure and fall back to basic extraction."""
+        if isinstance(error, AuthenticationError):
+            logger.error(f"OpenAI Authentication failed: {error}")
             logger.error("Check your OPENROUTER_API_KEY in .env file")
             # Authentication errors should not fall back silently
             result = self._basic_extraction(transcript, meeting_id)
-            result.meeting_metadata["extraction_error"] = f"Authentication failed: {str(e)}"
+            result.meeting_metadata["extraction_error"] = f"Authentication failed: {str(error)}"
             result.meeting_metadata["error_type"] = "auth_error"
             return result
             
-        except BadRequestError as e:
-            logger.error(f"OpenAI Bad Request: {e}")
+        if isinstance(error, BadRequestError):
+            logger.error(f"OpenAI Bad Request: {error}")
             logger.error(f"Model name being used: '{settings.clean_openrouter_model}'")
             logger.error(f"Raw model config: '{settings.openrouter_model}'")
             # This often indicates model name issues
             result = self._basic_extraction(transcript, meeting_id)
-            result.meeting_metadata["extraction_error"] = f"Bad request: {str(e)}"
+            result.meeting_metadata["extraction_error"] = f"Bad request: {str(error)}"
             result.meeting_metadata["error_type"] = "bad_request"
             result.meeting_metadata["model_attempted"] = settings.clean_openrouter_model
             return result
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {e}")
-            logger.error(f"Response content: {content[:500] if 'content' in locals() else 'N/A'}")
+        if isinstance(error, json.JSONDecodeError):
+            logger.error(f"Failed to parse LLM response as JSON: {error}")
+            logger.error(f"Response content: {error.doc[:500]}")
             result = self._basic_extraction(transcript, meeting_id)
-            result.meeting_metadata["extraction_error"] = f"JSON parse error: {str(e)}"
+            result.meeting_metadata["extraction_error"] = f"JSON parse error: {str(error)}"
             result.meeting_metadata["error_type"] = "parse_error"
             return result
             
-        except Exception as e:
-            logger.error(f"Unexpected extraction error: {type(e).__name__}: {e}")
-            logger.error(f"Full exception: ", exc_info=True)
-            # Generic fallback
-            result = self._basic_extraction(transcript, meeting_id)
-            result.meeting_metadata["extraction_error"] = f"{type(e).__name__}: {str(e)}"
-            result.meeting_metadata["error_type"] = "unknown_error"
-            return result
+        logger.error(f"Unexpected extraction error: {type(error).__name__}: {error}")
+        logger.error(f"Full exception: ", exc_info=error)
+        # Generic fallback
+        result = self._basic_extraction(transcript, meeting_id)
+        result.meeting_metadata["extraction_error"] = f"{type(error).__name__}: {str(error)}"
+        result.meeting_metadata["error_type"] = "unknown_error"
+        return result
     
     def _convert_to_extraction_result(self, data: Dict[str, Any], meeting_id: str, transcript: str) -> ExtractionResult:
         """Convert enhanced extraction to our ExtractionResult format."""
@@ -171,7 +171,7 @@ class ExtractionResult:
     action_items: List[Dict[str, Any]]
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryIntent:
     """Parsed intent from a user query."""
 
@@ -184,7 +184,7 @@ class QueryIntent:
     aggregation: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BIQueryResult:
     """Result from a business intelligence query."""
 
@@ -0,0 +1,173 @@
+"""
+Semantic cache for business intelligence answers.
+Serves a stored answer when a new question is a close paraphrase of one
+already answered, skipping the query engine and its LLM calls.
+"""
+
+import time
+import numpy as np
+from typing import Dict, Any, Optional, Iterable, List, Set
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    In-memory cache keyed by query embedding.
+
+    Entries live in one contiguous float32 matrix, preallocated to
+    max_entries rows, so a lookup is a single BLAS matrix-vector product
+    and an argmax. Vectors are L2-normalized, so the dot product is the
+    cosine similarity.
+    """
+
+    def __init__(
+        self,
+        embeddings,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        default_ttl: int = 1800,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            embeddings: EmbeddingEngine used to embed queries
+            threshold: Minimum cosine similarity to count as a hit
+            max_entries: Least recently used entries are dropped beyond this size
+            default_ttl: Time-to-live in seconds (default: 30 minutes)
+        """
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+
+        self._vectors = np.zeros(
+            (max_entries, embeddings.embedding_dim), dtype=np.float32
+        )
+        self._payloads: List[Dict[str, Any]] = []
+        self._entity_ids: List[Set[str]] = []
+        self._expires: List[float] = []
+        self._last_used: List[float] = []
+        self._hits = 0
+        self._misses = 0
+
+    def embed(self, query: str) -> np.ndarray:
+        """Embed a query as a 1D float32 vector."""
+        return self.embeddings.encode_one(query)
+
+    def lookup(self, query_embedding: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Find the cached payload for the most similar earlier query.
+
+        Args:
+            query_embedding: 1D normalized query embedding
+
+        Returns:
+            Cached payload if similarity >= threshold and not expired, None otherwise
+        """
+        if not self._payloads:
+            self._misses += 1
+            return None
+
+        query_embedding = self._normalize(query_embedding)
+        similarities = self._vectors[: len(self._payloads)] @ query_embedding
+        best = int(np.argmax(similarities))
+
+        if similarities[best] >= self.threshold:
+            now = time.time()
+            if now < self._expires[best]:
+                self._last_used[best] = now
+                self._hits += 1
+                logger.debug(
+                    f"Semantic cache hit (similarity {similarities[best]:.3f})"
+                )
+                return self._payloads[best]
+            self._remove([best])
+
+        self._misses += 1
+        return None
+
+    def insert(
+        self,
+        query_embedding: np.ndarray,
+        payload: Dict[str, Any],
+        entity_ids: Iterable[str] = (),
+        ttl: Optional[int] = None,
+    ):
+        """
+        Cache a payload under a query embedding.
+
+        Args:
+            query_embedding: 1D normalized query embedding
+            payload: Response to serve on a hit
+            entity_ids: Entities the answer depends on, for invalidation
+            ttl: Time-to-live in seconds (uses default if not specified)
+        """
+        if len(self._payloads) >= self.max_entries:
+            self._remove([int(np.argmin(self._last_used))])
+
+        now = time.time()
+        self._vectors[len(self._payloads)] = self._normalize(query_embedding)
+        self._payloads.append(payload)
+        self._entity_ids.append(set(entity_ids))
+        self._expires.append(now + (ttl or self.default_ttl))
+        self._last_used.append(now)
+
+    def invalidate_entities(self, entity_ids: Iterable[str]):
+        """
+        Drop entries that depend on any of the given entities.
+
+        Entries not tied to specific entities are dropped too, since new
+        data can change any aggregate answer.
+        """
+        changed = set(entity_ids)
+        stale = [
+            i
+            for i, ids in enumerate(self._entity_ids)
+            if not ids or ids & changed
+        ]
+        if stale:
+            self._remove(stale)
+            logger.debug(f"Semantic cache invalidated {len(stale)} entries")
+
+    def clear(self):
+        """Clear all cached entries."""
+        self._remove(range(len(self._payloads)))
+        self._hits = 0
+        self._misses = 0
+        logger.info("Semantic cache cleared")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total_requests = self._hits + self._misses
+        hit_rate = self._hits / total_requests if total_requests > 0 else 0
+
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": hit_rate,
+            "size": len(self._payloads),
+            "total_requests": total_requests,
+            "threshold": self.threshold,
+        }
+
+    @staticmethod
+    def _normalize(vector: np.ndarray) -> np.ndarray:
+        """Return the vector as float32 with unit L2 norm."""
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _remove(self, indices: Iterable[int]):
+        """Remove entries by position, compacting the matrix in place."""
+        drop = set(indices)
+        if not drop:
+            return
+        keep = [i for i in range(len(self._payloads)) if i not in drop]
+        self._vectors[: len(keep)] = self._vectors[keep]
+        self._payloads = [self._payloads[i] for i in keep]
+        self._entity_ids = [self._entity_ids[i] for i in keep]
+        self._expires = [self._expires[i] for i in keep]
+        self._last_used = [self._last_used[i] for i in keep]
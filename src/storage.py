@@ -2,9 +2,22 @@
 
 import sqlite3
 import json
+import orjson
+import threading
+import logging
+from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, PointStruct, VectorParams, Filter, FieldCondition, MatchValue, MatchAny
+from qdrant_client.models import (
+    HnswConfigDiff,
+    QuantizationSearchParams,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+    SearchRequest,
+)
 import numpy as np
 from datetime import datetime
 from .models import (
@@ -19,6 +32,43 @@ from .models import (
 )
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
+
+MEETING_COLUMNS = (
+    "id, title, transcript, participants, date, summary, topics, key_decisions, "
+    "action_items, created_at, memory_count, entity_count, email_metadata, "
+    "project_tags, meeting_type, actual_start_time, actual_end_time, "
+    "detailed_summary, raw_extraction, organization_context"
+)
+MEETING_JSON_COLUMNS = frozenset(
+    {"participants", "topics", "key_decisions", "action_items",
+     "email_metadata", "project_tags", "raw_extraction"}
+)
+MEETING_DATETIME_COLUMNS = frozenset(
+    {"date", "created_at", "actual_start_time", "actual_end_time"}
+)
+
+
+def _row_to_dict(row: sqlite3.Row, json_cols=frozenset()) -> Dict[str, Any]:
+    """Convert a sqlite3.Row to a dict, decoding only the JSON columns."""
+    return {
+        key: (orjson.loads(row[key]) if row[key] else None) if key in json_cols else row[key]
+        for key in row.keys()
+    }
+
+
+def _row_to_meeting(row: sqlite3.Row) -> Meeting:
+    """Build a Meeting from a row selected with MEETING_COLUMNS."""
+    data = _row_to_dict(row, MEETING_JSON_COLUMNS)
+    for key in MEETING_DATETIME_COLUMNS:
+        if data[key]:
+            data[key] = datetime.fromisoformat(data[key])
+    for key in ("participants", "topics", "key_decisions", "action_items", "project_tags"):
+        if data[key] is None:
+            data[key] = []
+    return Meeting(**data)
+
 
 class MemoryStorage:
     """Enhanced storage with entity tracking and BI capabilities."""
@@ -31,10 +81,58 @@ class MemoryStorage:
         # Initialize SQLite with enhanced schema
         self._init_sqlite()
 
+        # Long-lived connection for bulk/maintenance work (see raw_conn()).
+        # WAL + synchronous=NORMAL is what makes batched writes pay off: commits
+        # no longer fsync the main database file, and readers don't block the writer.
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA temp_store=MEMORY;
+            """
+        )
+
+        # Shared read-only connection for request-path reads. WAL lets it read
+        # while writers commit; the lock keeps cursors from interleaving when
+        # it is used from worker threads.
+        self.ro_conn = sqlite3.connect(
+            Path(self.db_path).resolve().as_uri() + "?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+        self.ro_conn.executescript(
+            """
+            PRAGMA query_only=1;
+            PRAGMA mmap_size=1073741824;
+            PRAGMA cache_size=-65536;
+            PRAGMA temp_store=MEMORY;
+            """
+        )
+        self.ro_lock = threading.Lock()
+
         # Initialize Qdrant
-        self.qdrant = QdrantClient(host=settings.qdrant_host, port=settings.qdrant_port)
+        self.qdrant = QdrantClient(
+            host=settings.qdrant_host,
+            port=settings.qdrant_port,
+            grpc_port=settings.qdrant_grpc_port,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+        )
         self._init_qdrant()
 
+        # Search the int8 index, then rescore 2x candidates at full precision
+        self._search_params = (
+            SearchParams(
+                quantization=QuantizationSearchParams(
+                    ignore=False, rescore=True, oversampling=2.0
+                )
+            )
+            if settings.qdrant_quantization
+            else None
+        )
+
     def _init_sqlite(self):
         """Create enhanced SQLite tables for business intelligence."""
         conn = sqlite3.connect(self.db_path)
@@ -271,9 +369,40 @@ class MemoryStorage:
         # CRITICAL: Add missing index for memories table to prevent timeouts
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_meeting_id ON memories(meeting_id)")
 
+        # Cache generation shared by every server worker; bumped after each
+        # ingest so all processes retire their cached responses
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        cursor.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', 0)")
+
         conn.commit()
         conn.close()
 
+    def raw_conn(self) -> sqlite3.Connection:
+        """Return the shared, tuned SQLite connection for bulk scans and scripts."""
+        return self.conn
+
+    def get_cache_generation(self) -> int:
+        """Get the shared cache generation (one indexed single-row read)."""
+        with self.ro_lock:
+            row = self.ro_conn.execute(
+                "SELECT value FROM meta WHERE key = 'generation'"
+            ).fetchone()
+        return row[0]
+
+    def bump_cache_generation(self) -> int:
+        """Advance the shared cache generation after data changed; returns the new value."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                row = conn.execute(
+                    "UPDATE meta SET value = value + 1 WHERE key = 'generation' RETURNING value"
+                ).fetchone()
+            return row[0]
+        finally:
+            conn.close()
+
     def _row_to_entity(self, row: sqlite3.Row) -> Entity:
         """Convert a database row to an Entity object.
         
@@ -284,7 +413,7 @@ class MemoryStorage:
             type=EntityType(row['type']),
             name=row['name'],
             normalized_name=row['normalized_name'],
-            attributes=json.loads(row['attributes']) if row['attributes'] else {},
+            attributes=orjson.loads(row['attributes']) if row['attributes'] else {},
             first_seen=datetime.fromisoformat(row['first_seen']),
             last_updated=datetime.fromisoformat(row['last_updated'])
         )
@@ -294,11 +423,32 @@ class MemoryStorage:
         collections = self.qdrant.get_collections().collections
         exists = any(c.name == self.collection_name for c in collections)
 
+        # int8 vectors kept in RAM cut search bandwidth 4x; search rescores
+        # the oversampled candidates against the original float32 vectors
+        quantization = None
+        if settings.qdrant_quantization:
+            quantization = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+
         if not exists:
             self.qdrant.create_collection(
                 collection_name=self.collection_name,
                 vectors_config=VectorParams(size=384, distance=Distance.COSINE),
+                hnsw_config=HnswConfigDiff(m=16, ef_construct=128),
+                quantization_config=quantization,
             )
+        elif quantization is not None:
+            # Quantize existing collections in place rather than recreating them
+            info = self.qdrant.get_collection(self.collection_name)
+            if info.config.quantization_config is None:
+                logger.info(f"Enabling int8 quantization on {self.collection_name}")
+                self.qdrant.update_collection(
+                    collection_name=self.collection_name,
+                    quantization_config=quantization,
+                )
         
         # Ensure entity embeddings collection exists
         entity_exists = any(c.name == settings.qdrant_entity_collection for c in collections)
@@ -372,7 +522,7 @@ class MemoryStorage:
             if existing:
                 # Update existing entity
                 entity_id = existing[0]
-                old_attrs = json.loads(existing[1]) if existing[1] else {}
+                old_attrs = orjson.loads(existing[1]) if existing[1] else {}
                 # Merge attributes
                 merged_attrs = {**old_attrs, **entity.attributes}
 
@@ -516,134 +666,199 @@ class MemoryStorage:
     
     def save_meeting_deliverables(self, meeting_id: str, deliverables: List[Dict[str, Any]]) -> None:
         """Save deliverable intelligence from meeting."""
-        if not deliverables:
-            return
-            
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for deliverable in deliverables:
-            import uuid
-            cursor.execute(
-                """
-                INSERT INTO meeting_deliverables 
-                (id, meeting_id, name, type, target_audience, requirements, 
-                 discussed_evolution, dependencies, deadline, format_preferences, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(uuid.uuid4()),
-                    meeting_id,
-                    deliverable.get("name"),
-                    deliverable.get("type"),
-                    json.dumps(deliverable.get("target_audience", [])),
-                    json.dumps(deliverable.get("requirements", [])),
-                    deliverable.get("discussed_evolution"),
-                    json.dumps(deliverable.get("dependencies", [])),
-                    deliverable.get("deadline"),
-                    deliverable.get("format_preferences"),
-                    datetime.now().isoformat()
-                )
-            )
-        
-        conn.commit()
-        conn.close()
+        self.save_meeting_intelligence(meeting_id, deliverables=deliverables)
     
     def save_stakeholder_intelligence(self, meeting_id: str, stakeholders: List[Dict[str, Any]]) -> None:
         """Save stakeholder intelligence from meeting."""
-        if not stakeholders:
-            return
-            
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for stakeholder in stakeholders:
-            import uuid
-            cursor.execute(
-                """
-                INSERT INTO stakeholder_intelligence
-                (id, meeting_id, stakeholder, role, communication_preferences,
-                 noted_concerns, format_preferences, questions_asked, key_interests, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(uuid.uuid4()),
-                    meeting_id,
-                    stakeholder.get("stakeholder"),
-                    stakeholder.get("role"),
-                    stakeholder.get("communication_preferences"),
-                    json.dumps(stakeholder.get("noted_concerns", [])),
-                    stakeholder.get("format_preferences"),
-                    json.dumps(stakeholder.get("questions_asked", [])),
-                    json.dumps(stakeholder.get("key_interests", [])),
-                    datetime.now().isoformat()
-                )
-            )
-        
-        conn.commit()
-        conn.close()
+        self.save_meeting_intelligence(meeting_id, stakeholders=stakeholders)
     
     def save_decisions_with_context(self, meeting_id: str, decisions: List[Dict[str, Any]]) -> None:
         """Save decisions with full context."""
-        if not decisions:
-            return
-            
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for decision in decisions:
-            import uuid
-            cursor.execute(
-                """
-                INSERT INTO decisions_with_context
-                (id, meeting_id, decision, rationale, stakeholders_involved,
-                 impact_areas, supersedes_decision, decision_status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(uuid.uuid4()),
-                    meeting_id,
-                    decision.get("decision"),
-                    decision.get("rationale"),
-                    json.dumps(decision.get("stakeholders_involved", [])),
-                    json.dumps(decision.get("impact_areas", [])),
-                    decision.get("supersedes_decision"),
-                    decision.get("decision_status", "proposed"),
-                    datetime.now().isoformat()
-                )
-            )
-        
-        conn.commit()
-        conn.close()
+        self.save_meeting_intelligence(meeting_id, decisions=decisions)
     
     def save_risk_areas(self, meeting_id: str, risks: List[Dict[str, Any]]) -> None:
         """Save identified risks from meeting."""
-        if not risks:
+        self.save_meeting_intelligence(meeting_id, risks=risks)
+
+    def save_meeting_intelligence(
+        self,
+        meeting_id: str,
+        deliverables: Optional[List[Dict[str, Any]]] = None,
+        stakeholders: Optional[List[Dict[str, Any]]] = None,
+        decisions: Optional[List[Dict[str, Any]]] = None,
+        risks: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Save deliverables, stakeholder intelligence, decisions and risks for a
+        meeting in one transaction, with one executemany per table.
+        """
+        if not (deliverables or stakeholders or decisions or risks):
             return
-            
+
+        import uuid
+        now = datetime.now().isoformat()
+
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for risk in risks:
-            import uuid
-            cursor.execute(
+        conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            with conn:
+                if deliverables:
+                    conn.executemany(
+                        """
+                        INSERT INTO meeting_deliverables 
+                        (id, meeting_id, name, type, target_audience, requirements, 
+                         discussed_evolution, dependencies, deadline, format_preferences, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                str(uuid.uuid4()),
+                                meeting_id,
+                                deliverable.get("name"),
+                                deliverable.get("type"),
+                                json.dumps(deliverable.get("target_audience", [])),
+                                json.dumps(deliverable.get("requirements", [])),
+                                deliverable.get("discussed_evolution"),
+                                json.dumps(deliverable.get("dependencies", [])),
+                                deliverable.get("deadline"),
+                                deliverable.get("format_preferences"),
+                                now
+                            )
+                            for deliverable in deliverables
+                        ]
+                    )
+
+                if stakeholders:
+                    conn.executemany(
+                        """
+                        INSERT INTO stakeholder_intelligence
+                        (id, meeting_id, stakeholder, role, communication_preferences,
+                         noted_concerns, format_preferences, questions_asked, key_interests, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                str(uuid.uuid4()),
+                                meeting_id,
+                                stakeholder.get("stakeholder"),
+                                stakeholder.get("role"),
+                                stakeholder.get("communication_preferences"),
+                                json.dumps(stakeholder.get("noted_concerns", [])),
+                                stakeholder.get("format_preferences"),
+                                json.dumps(stakeholder.get("questions_asked", [])),
+                                json.dumps(stakeholder.get("key_interests", [])),
+                                now
+                            )
+                            for stakeholder in stakeholders
+                        ]
+                    )
+
+                if decisions:
+                    conn.executemany(
+                        """
+                        INSERT INTO decisions_with_context
+                        (id, meeting_id, decision, rationale, stakeholders_involved,
+                         impact_areas, supersedes_decision, decision_status, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                str(uuid.uuid4()),
+                                meeting_id,
+                                decision.get("decision"),
+                                decision.get("rationale"),
+                                json.dumps(decision.get("stakeholders_involved", [])),
+                                json.dumps(decision.get("impact_areas", [])),
+                                decision.get("supersedes_decision"),
+                                decision.get("decision_status", "proposed"),
+                                now
+                            )
+                            for decision in decisions
+                        ]
+                    )
+
+                if risks:
+                    conn.executemany(
+                        """
+                        INSERT INTO risk_areas
+                        (id, meeting_id, risk, severity, mitigation_approach, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        [
+                            (
+                                str(uuid.uuid4()),
+                                meeting_id,
+                                risk.get("risk"),
+                                risk.get("severity", "medium"),
+                                risk.get("mitigation_approach"),
+                                now
+                            )
+                            for risk in risks
+                        ]
+                    )
+        finally:
+            conn.close()
+
+    def get_meeting_intelligence(self, meeting_id: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get deliverables, stakeholder intelligence, decisions and risks for a
+        meeting. SQLite assembles the nested JSON, so this is one query and one
+        decode regardless of row count.
+        """
+        with self.ro_lock:
+            row = self.ro_conn.execute(
                 """
-                INSERT INTO risk_areas
-                (id, meeting_id, risk, severity, mitigation_approach, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(uuid.uuid4()),
-                    meeting_id,
-                    risk.get("risk"),
-                    risk.get("severity", "medium"),
-                    risk.get("mitigation_approach"),
-                    datetime.now().isoformat()
+                SELECT json_object(
+                    'deliverables', (
+                        SELECT json_group_array(json_object(
+                            'name', name,
+                            'type', type,
+                            'target_audience', json(COALESCE(NULLIF(target_audience, ''), '[]')),
+                            'requirements', json(COALESCE(NULLIF(requirements, ''), '[]')),
+                            'discussed_evolution', discussed_evolution,
+                            'dependencies', json(COALESCE(NULLIF(dependencies, ''), '[]')),
+                            'deadline', deadline,
+                            'format_preferences', format_preferences
+                        ))
+                        FROM meeting_deliverables WHERE meeting_id = :meeting_id
+                    ),
+                    'stakeholder_intelligence', (
+                        SELECT json_group_array(json_object(
+                            'stakeholder', stakeholder,
+                            'role', role,
+                            'communication_preferences', communication_preferences,
+                            'noted_concerns', json(COALESCE(NULLIF(noted_concerns, ''), '[]')),
+                            'format_preferences', format_preferences,
+                            'questions_asked', json(COALESCE(NULLIF(questions_asked, ''), '[]')),
+                            'key_interests', json(COALESCE(NULLIF(key_interests, ''), '[]'))
+                        ))
+                        FROM stakeholder_intelligence WHERE meeting_id = :meeting_id
+                    ),
+                    'decisions_with_context', (
+                        SELECT json_group_array(json_object(
+                            'decision', decision,
+                            'rationale', rationale,
+                            'stakeholders_involved', json(COALESCE(NULLIF(stakeholders_involved, ''), '[]')),
+                            'impact_areas', json(COALESCE(NULLIF(impact_areas, ''), '[]')),
+                            'supersedes_decision', supersedes_decision,
+                            'decision_status', decision_status
+                        ))
+                        FROM decisions_with_context WHERE meeting_id = :meeting_id
+                    ),
+                    'risk_areas', (
+                        SELECT json_group_array(json_object(
+                            'risk', risk,
+                            'severity', severity,
+                            'mitigation_approach', mitigation_approach
+                        ))
+                        FROM risk_areas WHERE meeting_id = :meeting_id
+                    )
                 )
-            )
-        
-        conn.commit()
-        conn.close()
+                """,
+                {"meeting_id": meeting_id},
+            ).fetchone()
+
+        return orjson.loads(row[0])
 
     def get_entity_by_name(
         self, name: str, entity_type: Optional[str] = None
@@ -698,7 +913,7 @@ class MemoryStorage:
         conn.close()
 
         if row:
-            return json.loads(row[0])
+            return orjson.loads(row[0])
 
         return None
 
@@ -732,7 +947,7 @@ class MemoryStorage:
                     "from_entity": {"id": row[1], "name": row[8], "type": row[9]},
                     "to_entity": {"id": row[2], "name": row[10], "type": row[11]},
                     "relationship_type": row[3],
-                    "attributes": json.loads(row[4]) if row[4] else {},
+                    "attributes": orjson.loads(row[4]) if row[4] else {},
                     "meeting_id": row[5],
                     "timestamp": row[6],
                     "active": bool(row[7]),
@@ -742,6 +957,58 @@ class MemoryStorage:
         conn.close()
         return relationships
 
+    def get_entity_relationships_bulk(
+        self, entity_ids: List[str], active_only: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get relationships for multiple entities, keyed by entity ID."""
+        relationships = {entity_id: [] for entity_id in entity_ids}
+        if not entity_ids:
+            return relationships
+
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+
+        try:
+            # Chunk to stay under SQLite's bound-parameter limit (ids appear twice)
+            for start in range(0, len(entity_ids), 400):
+                chunk = entity_ids[start:start + 400]
+                placeholders = ",".join(["?"] * len(chunk))
+                query = f"""
+                    SELECT r.*, 
+                           e1.name as from_name, e1.type as from_type,
+                           e2.name as to_name, e2.type as to_type
+                    FROM entity_relationships r
+                    JOIN entities e1 ON r.from_entity_id = e1.id
+                    JOIN entities e2 ON r.to_entity_id = e2.id
+                    WHERE (r.from_entity_id IN ({placeholders})
+                           OR r.to_entity_id IN ({placeholders}))
+                """
+
+                if active_only:
+                    query += " AND r.active = 1"
+
+                cursor.execute(query, chunk + chunk)
+
+                for row in cursor.fetchall():
+                    relationship = {
+                        "id": row[0],
+                        "from_entity": {"id": row[1], "name": row[8], "type": row[9]},
+                        "to_entity": {"id": row[2], "name": row[10], "type": row[11]},
+                        "relationship_type": row[3],
+                        "attributes": orjson.loads(row[4]) if row[4] else {},
+                        "meeting_id": row[5],
+                        "timestamp": row[6],
+                        "active": bool(row[7]),
+                    }
+                    # A relationship can belong to both endpoints of the request
+                    for endpoint_id in {row[1], row[2]}:
+                        if endpoint_id in relationships:
+                            relationships[endpoint_id].append(relationship)
+        finally:
+            conn.close()
+
+        return relationships
+
     def get_entity_timeline(self, entity_id: str) -> List[Dict[str, Any]]:
         """Get timeline of state changes for an entity."""
         conn = sqlite3.connect(self.db_path)
@@ -763,9 +1030,9 @@ class MemoryStorage:
             timeline.append(
                 {
                     "id": row[0],
-                    "from_state": json.loads(row[2]) if row[2] else None,
-                    "to_state": json.loads(row[3]),
-                    "changed_fields": json.loads(row[4]) if row[4] else [],
+                    "from_state": orjson.loads(row[2]) if row[2] else None,
+                    "to_state": orjson.loads(row[3]),
+                    "changed_fields": orjson.loads(row[4]) if row[4] else [],
                     "reason": row[5],
                     "meeting_id": row[6],
                     "meeting_title": row[8],
@@ -778,34 +1045,44 @@ class MemoryStorage:
         return timeline
 
     def search_entities(
-        self, query: str, entity_type: Optional[str] = None
+        self,
+        query: str,
+        entity_type: Optional[str] = None,
+        allowed_types: Optional[List[str]] = None,
+        limit: Optional[int] = None,
     ) -> List[Entity]:
-        """Search for entities by name or attributes."""
+        """
+        Search for entities by name or attributes.
+
+        Args:
+            query: Substring to match against name or attributes
+            entity_type: Only return entities of this type
+            allowed_types: Only return entities whose type is one of these
+            limit: Stop after this many matches (newest first)
+        """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         # Simple fuzzy search
         search_pattern = f"%{query}%"
+        sql = "SELECT * FROM entities WHERE (name LIKE ? OR attributes LIKE ?)"
+        params: List[Any] = [search_pattern, search_pattern]
 
+        # Type filters run in SQL so non-matching rows are never materialized
         if entity_type:
-            cursor.execute(
-                """
-                SELECT * FROM entities 
-                WHERE (name LIKE ? OR attributes LIKE ?) AND type = ?
-                ORDER BY last_updated DESC
-            """,
-                (search_pattern, search_pattern, entity_type),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT * FROM entities 
-                WHERE name LIKE ? OR attributes LIKE ?
-                ORDER BY last_updated DESC
-            """,
-                (search_pattern, search_pattern),
-            )
+            sql += " AND type = ?"
+            params.append(entity_type)
+        if allowed_types is not None:
+            sql += f" AND type IN ({','.join(['?'] * len(allowed_types))})"
+            params.extend(allowed_types)
+
+        sql += " ORDER BY last_updated DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        cursor.execute(sql, params)
 
         entities = []
         for row in cursor.fetchall():
@@ -814,6 +1091,43 @@ class MemoryStorage:
         conn.close()
         return entities
 
+    def find_first_entity_matching(
+        self, queries: List[str], entity_types: List[str]
+    ) -> Optional[Entity]:
+        """
+        Find the first entity matching any of several searches, in one query.
+
+        Equivalent to calling search_entities() for each query in order and
+        taking the first result whose type is in entity_types.
+        """
+        if not queries or not entity_types:
+            return None
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            values = ",".join(["(?, ?)"] * len(queries))
+            type_placeholders = ",".join(["?"] * len(entity_types))
+            params: List[Any] = []
+            for position, query in enumerate(queries):
+                params.extend((position, f"%{query}%"))
+            params.extend(entity_types)
+            
+            row = conn.execute(
+                f"""
+                WITH searches(position, pattern) AS (VALUES {values})
+                SELECT e.* FROM searches s
+                JOIN entities e ON e.name LIKE s.pattern OR e.attributes LIKE s.pattern
+                WHERE e.type IN ({type_placeholders})
+                ORDER BY s.position, e.last_updated DESC
+                LIMIT 1
+            """,
+                params,
+            ).fetchone()
+            return self._row_to_entity(row) if row else None
+        finally:
+            conn.close()
+
     def get_all_entities(self, 
                         entity_type: Optional[EntityType] = None,
                         limit: Optional[int] = None,
@@ -871,6 +1185,24 @@ class MemoryStorage:
             ]
         )
 
+    def save_entity_embeddings_batch(self, entity_ids: List[str], embeddings: np.ndarray) -> None:
+        """Save many entity name embeddings to Qdrant in a single upsert."""
+        if not entity_ids:
+            return
+        
+        points = [
+            PointStruct(
+                id=entity_id,
+                vector=np.asarray(embedding, dtype=np.float32).reshape(-1).tolist(),
+                payload={"entity_id": entity_id}
+            )
+            for entity_id, embedding in zip(entity_ids, embeddings)
+        ]
+        self.qdrant.upsert(
+            collection_name=settings.qdrant_entity_collection,
+            points=points
+        )
+
     def get_entity_embedding(self, entity_id: str) -> Optional[np.ndarray]:
         """Retrieve a single entity's name embedding from Qdrant."""
         try:
@@ -900,6 +1232,28 @@ class MemoryStorage:
         )
         return [(result.id, result.score) for result in results]
 
+    def search_entity_embeddings_batch(
+        self, query_embeddings: np.ndarray, limit: int = 5
+    ) -> List[List[Tuple[str, float]]]:
+        """Search entity embeddings for several queries in one Qdrant request."""
+        query_embeddings = np.asarray(query_embeddings, dtype=np.float32)
+        if query_embeddings.ndim == 1:
+            query_embeddings = query_embeddings[None, :]
+        if len(query_embeddings) == 0:
+            return []
+        
+        batch_results = self.qdrant.search_batch(
+            collection_name=settings.qdrant_entity_collection,
+            requests=[
+                SearchRequest(vector=vector, limit=limit, with_payload=False)
+                for vector in query_embeddings.tolist()
+            ],
+        )
+        return [
+            [(result.id, result.score) for result in results]
+            for results in batch_results
+        ]
+
     def search_memories(self, query_embedding: np.ndarray, limit: int = 20, filters: Optional[Dict] = None) -> List[SearchResult]:
         """Compatibility wrapper for query engine - searches memories using vector similarity."""
         return self.search(query_embedding, limit, filters)
@@ -925,6 +1279,20 @@ class MemoryStorage:
             return self._row_to_entity(row)
         return None
 
+    def get_entity_type_counts(self) -> Dict[str, int]:
+        """
+        Get entity counts per type.
+
+        Counted in SQLite on every call: the GROUP BY walks idx_entities_type
+        without touching the table, and unlike a per-process counter it sees
+        inserts made by every server worker.
+        """
+        with self.ro_lock:
+            rows = self.ro_conn.execute(
+                "SELECT type, COUNT(*) FROM entities GROUP BY type"
+            ).fetchall()
+        return dict(rows)
+
     def get_analytics_data(
         self, metric: str, time_range: Optional[Tuple[datetime, datetime]] = None
     ) -> Dict[str, Any]:
@@ -1092,6 +1460,7 @@ class MemoryStorage:
                 query_vector=query_embedding.tolist(),
                 limit=limit,
                 query_filter=qdrant_filter,  # Note: some versions use 'query_filter'
+                search_params=self._search_params,
             )
         except TypeError:
             # Fallback if parameter name is different
@@ -1100,6 +1469,7 @@ class MemoryStorage:
                 query_vector=query_embedding.tolist(),
                 limit=limit,
                 filter=qdrant_filter,
+                search_params=self._search_params,
             )
 
         if not results:
@@ -1130,8 +1500,8 @@ class MemoryStorage:
                     content=row[2],
                     speaker=row[3],
                     timestamp=row[4],
-                    metadata=json.loads(row[5]) if row[5] else {},
-                    entity_mentions=json.loads(row[6]) if row[6] else [],
+                    metadata=orjson.loads(row[5]) if row[5] else {},
+                    entity_mentions=orjson.loads(row[6]) if row[6] else [],
                     embedding_id=row[7],
                     created_at=datetime.fromisoformat(row[8]),
                 )
@@ -1177,11 +1547,12 @@ class MemoryStorage:
     def get_meeting(self, meeting_id: str) -> Optional[Meeting]:
         """Get meeting by ID."""
         conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            SELECT * FROM meetings WHERE id = ?
+            f"""
+            SELECT {MEETING_COLUMNS} FROM meetings WHERE id = ?
         """,
             (meeting_id,),
         )
@@ -1189,77 +1560,21 @@ class MemoryStorage:
         row = cursor.fetchone()
         conn.close()
 
-        if row:
-            meeting = Meeting(
-                id=row[0],
-                title=row[1],
-                transcript=row[2],
-                participants=json.loads(row[3]) if row[3] else [],
-                date=datetime.fromisoformat(row[4]) if row[4] else None,
-                summary=row[5],
-                topics=json.loads(row[6]) if row[6] else [],
-                key_decisions=json.loads(row[7]) if row[7] else [],
-                action_items=json.loads(row[8]) if row[8] else [],
-                created_at=datetime.fromisoformat(row[9]),
-                memory_count=row[10],
-                entity_count=row[11],
-            )
-            
-            # Handle new fields if they exist (backward compatibility)
-            if len(row) > 12:
-                meeting.email_metadata = json.loads(row[12]) if row[12] else None
-                meeting.project_tags = json.loads(row[13]) if row[13] else []
-                meeting.meeting_type = row[14]
-                meeting.actual_start_time = datetime.fromisoformat(row[15]) if row[15] else None
-                meeting.actual_end_time = datetime.fromisoformat(row[16]) if row[16] else None
-                meeting.detailed_summary = row[17]
-                meeting.raw_extraction = json.loads(row[18]) if row[18] else None
-                meeting.organization_context = row[19]
-            
-            return meeting
-
-        return None
+        return _row_to_meeting(row) if row else None
 
     def get_all_meetings(self) -> List[Meeting]:
         """Get all meetings."""
         conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            SELECT * FROM meetings ORDER BY created_at DESC
+            f"""
+            SELECT {MEETING_COLUMNS} FROM meetings ORDER BY created_at DESC
         """
         )
 
-        meetings = []
-        for row in cursor.fetchall():
-            meeting = Meeting(
-                id=row[0],
-                title=row[1],
-                transcript=row[2],
-                participants=json.loads(row[3]) if row[3] else [],
-                date=datetime.fromisoformat(row[4]) if row[4] else None,
-                summary=row[5],
-                topics=json.loads(row[6]) if row[6] else [],
-                key_decisions=json.loads(row[7]) if row[7] else [],
-                action_items=json.loads(row[8]) if row[8] else [],
-                created_at=datetime.fromisoformat(row[9]),
-                memory_count=row[10],
-                entity_count=row[11],
-            )
-            
-            # Handle new fields if they exist (backward compatibility)
-            if len(row) > 12:
-                meeting.email_metadata = json.loads(row[12]) if row[12] else None
-                meeting.project_tags = json.loads(row[13]) if row[13] else []
-                meeting.meeting_type = row[14]
-                meeting.actual_start_time = datetime.fromisoformat(row[15]) if row[15] else None
-                meeting.actual_end_time = datetime.fromisoformat(row[16]) if row[16] else None
-                meeting.detailed_summary = row[17]
-                meeting.raw_extraction = json.loads(row[18]) if row[18] else None
-                meeting.organization_context = row[19]
-            
-            meetings.append(meeting)
+        meetings = [_row_to_meeting(row) for row in cursor.fetchall()]
 
         conn.close()
         return meetings
@@ -1287,8 +1602,8 @@ class MemoryStorage:
                     content=row[2],
                     speaker=row[3],
                     timestamp=row[4],
-                    metadata=json.loads(row[5]) if row[5] else {},
-                    entity_mentions=json.loads(row[6]) if row[6] else [],
+                    metadata=orjson.loads(row[5]) if row[5] else {},
+                    entity_mentions=orjson.loads(row[6]) if row[6] else [],
                     embedding_id=row[7],
                     created_at=datetime.fromisoformat(row[8]),
                 )
@@ -1331,7 +1646,7 @@ class MemoryStorage:
                 if key in existing_entities:
                     # Prepare update
                     entity_id = existing_entities[key]['id']
-                    old_attrs = json.loads(existing_entities[key]['attrs']) if existing_entities[key]['attrs'] else {}
+                    old_attrs = orjson.loads(existing_entities[key]['attrs']) if existing_entities[key]['attrs'] else {}
                     merged_attrs = {**old_attrs, **entity.attributes}
                     updates.append((json.dumps(merged_attrs), datetime.now().isoformat(), entity_id))
                     saved_ids.append(entity_id)
@@ -1429,6 +1744,59 @@ class MemoryStorage:
         finally:
             conn.close()
     
+    def get_entity_ids_by_names(self, names: List[str]) -> List[str]:
+        """Resolve names to entity IDs, chunked to stay under SQLite's variable limit."""
+        unique_names = list({name.lower().strip() for name in names})
+        if not unique_names:
+            return []
+        
+        conn = sqlite3.connect(self.db_path)
+        try:
+            entity_ids = []
+            for i in range(0, len(unique_names), 500):
+                chunk = unique_names[i:i + 500]
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT id FROM entities WHERE normalized_name IN ({placeholders})",
+                    chunk,
+                )
+                entity_ids.extend(row[0] for row in cursor)
+            return entity_ids
+        finally:
+            conn.close()
+    
+    def get_entities_by_names(self, names: List[str]) -> Dict[str, Entity]:
+        """Get entities for multiple names in a single query, keyed by the given name."""
+        if not names:
+            return {}
+        
+        normalized = {name: name.lower().strip() for name in names}
+        
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        
+        try:
+            unique_names = list(set(normalized.values()))
+            placeholders = ','.join(['?'] * len(unique_names))
+            cursor.execute(f"""
+                SELECT * FROM entities
+                WHERE normalized_name IN ({placeholders})
+            """, unique_names)
+            
+            by_normalized = {}
+            for row in cursor.fetchall():
+                by_normalized.setdefault(row["normalized_name"], self._row_to_entity(row))
+            
+            # Preserve the caller's ordering
+            return {
+                name: by_normalized[norm]
+                for name, norm in normalized.items()
+                if norm in by_normalized
+            }
+        finally:
+            conn.close()
+    
     def search_memories(
         self, 
         query_embedding: np.ndarray,
@@ -1482,8 +1850,8 @@ class MemoryStorage:
                         content=row[2],
                         speaker=row[3],
                         timestamp=row[4],
-                        metadata=json.loads(row[5]) if row[5] else {},
-                        entity_mentions=json.loads(row[6]) if row[6] else [],
+                        metadata=orjson.loads(row[5]) if row[5] else {},
+                        entity_mentions=orjson.loads(row[6]) if row[6] else [],
                         embedding_id=row[7],
                         created_at=datetime.fromisoformat(row[8])
                     )
@@ -1505,30 +1873,33 @@ class MemoryStorage:
         cursor = conn.cursor()
         
         try:
-            # Get the most recent state for each entity
-            placeholders = ','.join(['?'] * len(entity_ids))
-            cursor.execute(f"""
-                SELECT es1.*
-                FROM entity_states es1
-                INNER JOIN (
-                    SELECT entity_id, MAX(timestamp) as max_timestamp
-                    FROM entity_states
-                    WHERE entity_id IN ({placeholders})
-                    GROUP BY entity_id
-                ) es2 ON es1.entity_id = es2.entity_id AND es1.timestamp = es2.max_timestamp
-            """, entity_ids)
-            
             states = {}
-            for row in cursor.fetchall():
-                state = EntityState(
-                    id=row[0],
-                    entity_id=row[1],
-                    state=json.loads(row[2]) if row[2] else {},
-                    meeting_id=row[3],
-                    timestamp=datetime.fromisoformat(row[4]),
-                    confidence=row[5]
-                )
-                states[state.entity_id] = state
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(entity_ids), 400):
+                chunk = entity_ids[start:start + 400]
+                placeholders = ','.join(['?'] * len(chunk))
+                # Get the most recent state for each entity
+                cursor.execute(f"""
+                    SELECT es1.*
+                    FROM entity_states es1
+                    INNER JOIN (
+                        SELECT entity_id, MAX(timestamp) as max_timestamp
+                        FROM entity_states
+                        WHERE entity_id IN ({placeholders})
+                        GROUP BY entity_id
+                    ) es2 ON es1.entity_id = es2.entity_id AND es1.timestamp = es2.max_timestamp
+                """, chunk)
+                
+                for row in cursor.fetchall():
+                    state = EntityState(
+                        id=row[0],
+                        entity_id=row[1],
+                        state=orjson.loads(row[2]) if row[2] else {},
+                        meeting_id=row[3],
+                        timestamp=datetime.fromisoformat(row[4]),
+                        confidence=row[5]
+                    )
+                    states[state.entity_id] = state
             
             return states
         finally: